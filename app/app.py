@@ -7,9 +7,13 @@ Author: Generated for Citizen Science Project
 Date: 2024
 """
 
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
 import streamlit as st
 import pandas as pd
 from pathlib import Path
+from streamlit.runtime.scriptrunner import add_script_run_ctx, get_script_run_ctx
 
 # Import custom modules
 from config import (
@@ -58,13 +62,31 @@ def init_session_state():
 
 @st.cache_resource
 def load_all_data():
-    """Load all datasets and cache for performance."""
-    data = {
-        'citizen_science': load_citizen_science_data(),
-        'gbif': load_gbif_data(),
-        'utm_grid': load_utm_grid(),
-        'cameras': load_camera_locations()
+    """Load all datasets concurrently and cache for performance."""
+    loaders = {
+        'citizen_science': load_citizen_science_data,
+        'gbif': load_gbif_data,
+        'utm_grid': load_utm_grid,
+        'cameras': load_camera_locations
     }
+    
+    # Shapefile reads spend most of their time in GDAL, which releases the
+    # GIL, so the loaders overlap well in threads. Workers share the script
+    # context so loader error messages still reach the page.
+    ctx = get_script_run_ctx()
+    with ThreadPoolExecutor(
+        max_workers=len(loaders),
+        initializer=lambda: add_script_run_ctx(threading.current_thread(), ctx)
+    ) as executor:
+        futures = {key: executor.submit(loader) for key, loader in loaders.items()}
+        data = {key: future.result() for key, future in futures.items()}
+    
+    # Sidebar filter options only depend on the full dataset
+    df = data['citizen_science']
+    data['species_list'] = get_species_list(df)
+    data['grid_list'] = get_grid_list(df)
+    data['source_list'] = get_data_sources(df)
+    data['records_max'] = int(df['Records'].max()) if not df.empty else 0
     return data
 
 
@@ -72,7 +94,7 @@ def load_all_data():
 # SIDEBAR
 # ============================================================================
 
-def render_sidebar(df):
+def render_sidebar(df, data, stats):
     """Render sidebar with filters and navigation."""
     
     with st.sidebar:
@@ -94,7 +116,7 @@ def render_sidebar(df):
         st.subheader("🔍 Data Filters")
         
         # Species filter
-        species_list = ['All'] + get_species_list(df)
+        species_list = ['All'] + data['species_list']
         selected_species = st.selectbox(
             "Select Species",
             options=species_list,
@@ -103,7 +125,7 @@ def render_sidebar(df):
         )
         
         # Grid filter
-        grid_list = ['All'] + get_grid_list(df)
+        grid_list = ['All'] + data['grid_list']
         selected_grid = st.selectbox(
             "Select UTM Grid",
             options=grid_list,
@@ -112,7 +134,7 @@ def render_sidebar(df):
         )
         
         # Data source filter
-        source_list = ['All'] + get_data_sources(df)
+        source_list = ['All'] + data['source_list']
         selected_source = st.selectbox(
             "Select Data Source",
             options=source_list,
@@ -124,7 +146,7 @@ def render_sidebar(df):
         min_records = st.slider(
             "Minimum Records",
             min_value=0,
-            max_value=int(df['Records'].max()),
+            max_value=data['records_max'],
             value=0,
             step=1,
             key='min_records_filter'
@@ -141,7 +163,6 @@ def render_sidebar(df):
         
         # Dataset info
         with st.expander("📊 Dataset Info"):
-            stats = get_summary_stats(df)
             st.metric("Total Records", f"{stats['total_records']:,}")
             st.metric("Unique Species", stats['unique_species'])
             st.metric("UTM Grids", stats['unique_grids'])
@@ -201,16 +222,27 @@ def main():
         st.error("❌ Failed to load data. Please check data files.")
         return
     
+    # Full-dataset stats are shared by the sidebar and the unfiltered view
+    stats_full = get_summary_stats(df)
+    
     # Render sidebar and get filters
-    page, species, grid, source, min_records, apply_filters = render_sidebar(df)
+    page, species, grid, source, min_records, apply_filters = render_sidebar(df, data, stats_full)
     
     # Apply filters if requested
+    df_filtered = df
     if apply_filters or st.session_state.get('filters_applied', False):
-        df_filtered = filter_data(df, species, grid, source, min_records)
         st.session_state.filters_applied = True
         
-        # Show filter summary
-        if species != 'All' or grid != 'All' or source != 'All' or min_records > 0:
+        # Only filter (and show a summary) when a filter differs from its default
+        selected_filters = {
+            'species': species,
+            'grid': grid,
+            'source': source,
+            'min_records': min_records
+        }
+        if selected_filters != DEFAULT_FILTERS:
+            df_filtered = filter_data(df, species, grid, source, min_records)
+            
             filter_summary = []
             if species != 'All':
                 filter_summary.append(f"Species: **{species}**")
@@ -222,12 +254,10 @@ def main():
                 filter_summary.append(f"Min Records: **{min_records}**")
             
             st.info(f"🔍 Active Filters: {' | '.join(filter_summary)}")
-    else:
-        df_filtered = df
     
     # Show filtered data stats
     col1, col2, col3, col4 = st.columns(4)
-    stats = get_summary_stats(df_filtered)
+    stats = stats_full if df_filtered is df else get_summary_stats(df_filtered)
     
     with col1:
         st.metric("📝 Total Records", f"{stats['total_records']:,}")
@@ -50,12 +50,28 @@ GENERATED_MAPS = {
 
 DATA_FILES = {
     'citizen_science': DATA_DIR / 'dataset_CSsources_mod.csv',
+    'citizen_science_parquet': DATA_DIR / 'dataset_CSsources_mod.parquet',
     'gbif_shapefile': DATA_DIR / 'GBIFdata_CO.shp',
+    'gbif_parquet': DATA_DIR / 'GBIFdata_CO.parquet',
     'utm_grid': DATA_DIR / 'CO_UTM2.shp',
+    'utm_grid_parquet': DATA_DIR / 'CO_UTM2.parquet',
     'cameras': DATA_DIR / 'locCam3.csv',
     'silhouettes': DATA_DIR / 'siluetas.csv'
 }
 
+# Repeated string columns stored as categoricals (small integer codes)
+CATEGORICAL_COLUMNS = ['Species.Name', 'Grid', 'Data.Source']
+GBIF_CATEGORICAL_COLUMNS = ['genus', 'family', 'order', 'institut_1', 'CUADRICULA']
+
+# Whole-number GBIF date parts downcast from float64 when they have no gaps
+GBIF_INTEGER_COLUMNS = {'year': 'int16', 'month': 'int8', 'day': 'int8'}
+
+# Columns shown in the citizen science records table ('spp' duplicates Species.Name)
+CS_DISPLAY_COLUMNS = ['Species.Name', 'Grid', 'Data.Source', 'Records']
+
+# Columns shown in the GBIF records table, when present in the shapefile
+GBIF_DISPLAY_COLUMNS = ['genus', 'family', 'order', 'year', 'institut_1', 'CUADRICULA']
+
 
 # ============================================================================
 # COLOR PALETTES
@@ -111,12 +127,32 @@ MAP_CONFIG = {
     'tile_layer': 'OpenStreetMap'
 }
 
+# Pre-rendered GBIF density raster used as the custom map heat layer
+HEAT_RASTER_CONFIG = {
+    'bins': 512,
+    'sigma': 4,
+    # Leaflet.heat default gradient: density stop -> RGB
+    'gradient': {
+        0.0: (0, 0, 255),
+        0.4: (0, 0, 255),
+        0.6: (0, 255, 255),
+        0.7: (0, 255, 0),
+        0.8: (255, 255, 0),
+        1.0: (255, 0, 0)
+    },
+    'opacity': 0.6,
+    'min_density': 0.02
+}
+
 # Chart settings
 CHART_CONFIG = {
     'default_height': 500,
     'default_width': 800,
     'dpi': 300,
-    'font_size': 12
+    'font_size': 12,
+    'max_point_labels': 30,
+    'max_heatmap_labels': 400,
+    'max_sunburst_segments': 500
 }
 
 
@@ -0,0 +1,29 @@
+"""
+Data Conversion Script
+======================
+One-off conversion of source data files into faster columnar formats.
+
+Usage (from the 'app' folder):
+    python convert_data.py
+"""
+
+from data_loader import (
+    convert_citizen_science_to_parquet, convert_gbif_to_geoparquet,
+    convert_utm_grid_to_geoparquet
+)
+
+
+def main():
+    """Run all data conversions."""
+    output_path = convert_citizen_science_to_parquet()
+    print(f"Citizen science data written to {output_path}")
+    
+    output_path = convert_gbif_to_geoparquet()
+    print(f"GBIF occurrences written to {output_path}")
+    
+    output_path = convert_utm_grid_to_geoparquet()
+    print(f"UTM grid written to {output_path}")
+
+
+if __name__ == "__main__":
+    main()
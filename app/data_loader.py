@@ -9,27 +9,67 @@ import pandas as pd
 import geopandas as gpd
 import streamlit as st
 from pathlib import Path
-from typing import Dict, Tuple, Optional
+from typing import Dict, List, Tuple, Optional
 import numpy as np
+import json
 import os
+from scipy.ndimage import gaussian_filter
 
-from config import DATA_FILES, GENERATED_IMAGES, GENERATED_MAPS
+from config import (
+    DATA_FILES, CATEGORICAL_COLUMNS, GBIF_CATEGORICAL_COLUMNS, GBIF_INTEGER_COLUMNS,
+    GENERATED_IMAGES, GENERATED_MAPS,
+    IMG_DIR, HTML_DIR, EXPORT_CONFIG,
+    HEAT_RASTER_CONFIG, CHART_CONFIG
+)
 
 
 # ============================================================================
 # DATA LOADING FUNCTIONS
 # ============================================================================
+# Loaders use st.cache_resource so every rerun receives the same object by
+# reference instead of an unpickled copy. Callers must treat the returned
+# frames as read-only and .copy() them before any in-place modification.
 
-@st.cache_data(ttl=3600)
+def _clean_records(records: pd.Series) -> pd.Series:
+    """
+    Coerce record counts to the smallest integer type that holds them.
+    
+    Args:
+        records: Raw 'Records' column
+        
+    Returns:
+        pd.Series: Numeric counts (int16/int32/int64 when all values are whole)
+    """
+    records = pd.to_numeric(records, errors='coerce').fillna(0)
+    if records.empty or not (records % 1 == 0).all():
+        return records
+    
+    for dtype in (np.int16, np.int32):
+        info = np.iinfo(dtype)
+        if records.min() >= info.min and records.max() <= info.max:
+            return records.astype(dtype)
+    return records.astype(np.int64)
+
+
+@st.cache_resource(ttl=3600)
 def load_citizen_science_data() -> pd.DataFrame:
     """
-    Load citizen science records from CSV file.
+    Load citizen science records.
+    
+    Reads the Parquet copy of the dataset when available (see
+    ``convert_data.py``) and falls back to the original CSV otherwise.
     
     Returns:
         pd.DataFrame: Citizen science records with species, grid, source, and counts
     """
     try:
-        df = pd.read_csv(DATA_FILES['citizen_science'])
+        parquet_path = DATA_FILES['citizen_science_parquet']
+        if os.path.exists(parquet_path):
+            # Schema (categoricals, numeric Records) is enforced at conversion time
+            df = pd.read_parquet(parquet_path, engine='pyarrow')
+        else:
+            # Arrow's multithreaded CSV parser is much faster than the default engine
+            df = pd.read_csv(DATA_FILES['citizen_science'], engine='pyarrow')
         
         # Ensure required columns exist
         required_cols = ['Species.Name', 'Grid', 'Data.Source', 'Records']
@@ -39,7 +79,8 @@ def load_citizen_science_data() -> pd.DataFrame:
         
         # Clean data
         df = df.dropna(subset=['Species.Name', 'Records'])
-        df['Records'] = pd.to_numeric(df['Records'], errors='coerce').fillna(0)
+        df['Records'] = _clean_records(df['Records'])
+        df = df.astype({col: 'category' for col in CATEGORICAL_COLUMNS})
         
         return df
     
@@ -48,24 +89,36 @@ def load_citizen_science_data() -> pd.DataFrame:
         return pd.DataFrame()
 
 
-@st.cache_data(ttl=3600)
+@st.cache_resource(ttl=3600)
 def load_gbif_data() -> gpd.GeoDataFrame:
     """
-    Load GBIF occurrence data from shapefile.
+    Load GBIF occurrence data.
+    
+    Reads the GeoParquet copy (with pre-extracted coordinates) when available
+    and falls back to the original shapefile otherwise.
     
     Returns:
         gpd.GeoDataFrame: GBIF records with geometry and attributes
     """
     try:
-        gdf = gpd.read_file(DATA_FILES['gbif_shapefile'])
+        parquet_path = DATA_FILES['gbif_parquet']
+        if os.path.exists(parquet_path):
+            gdf = gpd.read_parquet(parquet_path)
+        else:
+            gdf = gpd.read_file(DATA_FILES['gbif_shapefile'])
         
         # Extract coordinates
-        gdf['Longitude'] = gdf.geometry.x
-        gdf['Latitude'] = gdf.geometry.y
+        if 'Longitude' not in gdf.columns or 'Latitude' not in gdf.columns:
+            gdf['Longitude'] = gdf.geometry.x
+            gdf['Latitude'] = gdf.geometry.y
         
         # Remove null coordinates
         gdf = gdf.dropna(subset=['Latitude', 'Longitude'])
         
+        # Taxonomy and provider columns repeat heavily; store as categoricals
+        gdf = gdf.astype({col: 'category' for col in GBIF_CATEGORICAL_COLUMNS if col in gdf.columns})
+        gdf = _downcast_gbif_integers(gdf)
+        
         return gdf
     
     except Exception as e:
@@ -73,16 +126,42 @@ def load_gbif_data() -> gpd.GeoDataFrame:
         return gpd.GeoDataFrame()
 
 
-@st.cache_data(ttl=3600)
+def _downcast_gbif_integers(gdf: gpd.GeoDataFrame) -> gpd.GeoDataFrame:
+    """
+    Store whole-number GBIF date columns as small integers.
+    
+    Shapefiles deliver year/month/day as float64; columns with missing
+    values keep that dtype since NumPy integers cannot hold NaN.
+    
+    Args:
+        gdf: GBIF GeoDataFrame
+        
+    Returns:
+        gpd.GeoDataFrame: Frame with complete date columns downcast
+    """
+    return gdf.astype({
+        col: dtype for col, dtype in GBIF_INTEGER_COLUMNS.items()
+        if col in gdf.columns and gdf[col].notna().all()
+    })
+
+
+@st.cache_resource(ttl=3600)
 def load_utm_grid() -> gpd.GeoDataFrame:
     """
     Load UTM grid polygons (10x10 km cells).
     
+    Reads the GeoParquet copy when available and falls back to the original
+    shapefile otherwise.
+    
     Returns:
         gpd.GeoDataFrame: UTM grid cells with geometry
     """
     try:
-        gdf = gpd.read_file(DATA_FILES['utm_grid'])
+        parquet_path = DATA_FILES['utm_grid_parquet']
+        if os.path.exists(parquet_path):
+            gdf = gpd.read_parquet(parquet_path)
+        else:
+            gdf = gpd.read_file(DATA_FILES['utm_grid'])
         return gdf
     
     except Exception as e:
@@ -90,7 +169,7 @@ def load_utm_grid() -> gpd.GeoDataFrame:
         return gpd.GeoDataFrame()
 
 
-@st.cache_data(ttl=3600)
+@st.cache_resource(ttl=3600)
 def load_camera_locations() -> pd.DataFrame:
     """
     Load camera trap location data.
@@ -119,7 +198,7 @@ def load_camera_locations() -> pd.DataFrame:
         return pd.DataFrame()
 
 
-@st.cache_data(ttl=3600)
+@st.cache_resource(ttl=3600)
 def load_species_silhouettes() -> pd.DataFrame:
     """
     Load species silhouette URLs for visualization.
@@ -136,10 +215,83 @@ def load_species_silhouettes() -> pd.DataFrame:
         return pd.DataFrame()
 
 
+def convert_citizen_science_to_parquet() -> Path:
+    """
+    Convert the citizen science CSV into a zstd-compressed Parquet file.
+    
+    Repeated string columns are stored as categoricals and ``Records`` is
+    downcast to a compact integer type, so loading the Parquet file needs no
+    cleaning.
+    
+    Returns:
+        Path: Location of the written Parquet file
+    """
+    df = pd.read_csv(DATA_FILES['citizen_science'])
+    df['Records'] = _clean_records(df['Records'])
+    df = df.astype({col: 'category' for col in CATEGORICAL_COLUMNS})
+    
+    output_path = DATA_FILES['citizen_science_parquet']
+    df.to_parquet(output_path, engine='pyarrow', compression='zstd', index=False)
+    return output_path
+
+
+def convert_gbif_to_geoparquet() -> Path:
+    """
+    Convert the GBIF shapefile into GeoParquet with coordinate columns.
+    
+    Taxonomy and provider columns are stored as categoricals and complete
+    date parts as small integers.
+    
+    Returns:
+        Path: Location of the written GeoParquet file
+    """
+    gdf = gpd.read_file(DATA_FILES['gbif_shapefile'])
+    gdf['Longitude'] = gdf.geometry.x
+    gdf['Latitude'] = gdf.geometry.y
+    gdf = gdf.astype({col: 'category' for col in GBIF_CATEGORICAL_COLUMNS if col in gdf.columns})
+    gdf = _downcast_gbif_integers(gdf)
+    
+    output_path = DATA_FILES['gbif_parquet']
+    gdf.to_parquet(output_path, compression='zstd', index=False)
+    return output_path
+
+
+def convert_utm_grid_to_geoparquet() -> Path:
+    """
+    Convert the UTM grid shapefile into GeoParquet.
+    
+    Returns:
+        Path: Location of the written GeoParquet file
+    """
+    gdf = gpd.read_file(DATA_FILES['utm_grid'])
+    
+    output_path = DATA_FILES['utm_grid_parquet']
+    gdf.to_parquet(output_path, compression='zstd', index=False)
+    return output_path
+
+
 # ============================================================================
 # DATA PROCESSING FUNCTIONS
 # ============================================================================
 
+def frame_fingerprint(df: pd.DataFrame) -> Tuple:
+    """
+    Cheap cache key for DataFrames derived from the cached dataset.
+    
+    Filtered frames are row subsets of the loaded data, so shape, columns and
+    row index labels identify them without hashing every cell.
+    
+    Args:
+        df: DataFrame to fingerprint
+        
+    Returns:
+        Tuple: Hashable fingerprint passed to Streamlit's cache
+    """
+    index_hash = pd.util.hash_array(df.index.to_numpy()).tobytes()
+    return df.shape, tuple(df.columns), index_hash
+
+
+@st.cache_data(ttl=3600, hash_funcs={pd.DataFrame: frame_fingerprint})
 def get_species_list(df: pd.DataFrame) -> list:
     """
     Extract unique species names from dataset.
@@ -151,11 +303,15 @@ def get_species_list(df: pd.DataFrame) -> list:
         list: Sorted list of unique species names
     """
     if 'Species.Name' in df.columns:
+        if isinstance(df['Species.Name'].dtype, pd.CategoricalDtype):
+            # Categories are already unique and sorted
+            return df['Species.Name'].cat.categories.tolist()
         species = df['Species.Name'].dropna().unique()
-        return sorted(species.tolist())
+        return np.sort(np.asarray(species)).tolist()
     return []
 
 
+@st.cache_data(ttl=3600, hash_funcs={pd.DataFrame: frame_fingerprint})
 def get_grid_list(df: pd.DataFrame) -> list:
     """
     Extract unique grid IDs from dataset.
@@ -167,11 +323,15 @@ def get_grid_list(df: pd.DataFrame) -> list:
         list: Sorted list of unique grid IDs
     """
     if 'Grid' in df.columns:
+        if isinstance(df['Grid'].dtype, pd.CategoricalDtype):
+            # Categories are already unique and sorted
+            return df['Grid'].cat.categories.tolist()
         grids = df['Grid'].dropna().unique()
-        return sorted(grids.tolist())
+        return np.sort(np.asarray(grids)).tolist()
     return []
 
 
+@st.cache_data(ttl=3600, hash_funcs={pd.DataFrame: frame_fingerprint})
 def get_data_sources(df: pd.DataFrame) -> list:
     """
     Extract unique data sources from dataset.
@@ -180,14 +340,18 @@ def get_data_sources(df: pd.DataFrame) -> list:
         df: DataFrame with 'Data.Source' column
         
     Returns:
-        list: List of unique data sources
+        list: Sorted list of unique data sources
     """
     if 'Data.Source' in df.columns:
+        if isinstance(df['Data.Source'].dtype, pd.CategoricalDtype):
+            # Categories are already unique and sorted
+            return df['Data.Source'].cat.categories.tolist()
         sources = df['Data.Source'].dropna().unique()
-        return sorted(sources.tolist())
+        return np.sort(np.asarray(sources)).tolist()
     return []
 
 
+@st.cache_resource(ttl=3600, max_entries=100, hash_funcs={pd.DataFrame: frame_fingerprint})
 def filter_data(
     df: pd.DataFrame,
     species: Optional[str] = None,
@@ -198,6 +362,9 @@ def filter_data(
     """
     Apply filters to the dataset.
     
+    Results are cached per filter combination and shared between reruns, so
+    the returned frame must not be modified in place.
+    
     Args:
         df: Input DataFrame
         species: Filter by species name (None or 'All' for no filter)
@@ -208,31 +375,33 @@ def filter_data(
     Returns:
         pd.DataFrame: Filtered DataFrame
     """
-    filtered = df.copy()
+    # Build a single boolean mask so the frame is indexed only once
+    mask = np.ones(len(df), dtype=bool)
     
     # Apply species filter
     if species and species != 'All':
-        filtered = filtered[filtered['Species.Name'] == species]
+        mask &= df['Species.Name'].to_numpy() == species
     
     # Apply grid filter
     if grid and grid != 'All':
-        filtered = filtered[filtered['Grid'] == grid]
+        mask &= df['Grid'].to_numpy() == grid
     
     # Apply source filter
     if source and source != 'All':
-        filtered = filtered[filtered['Data.Source'] == source]
+        mask &= df['Data.Source'].to_numpy() == source
     
     # Apply minimum records filter
     if min_records > 0:
-        filtered = filtered[filtered['Records'] >= min_records]
+        mask &= df['Records'].to_numpy() >= min_records
     
-    return filtered
+    return df.loc[mask]
 
 
 # ============================================================================
 # AGGREGATION FUNCTIONS
 # ============================================================================
 
+@st.cache_data(ttl=3600, max_entries=32, show_spinner=False, hash_funcs={pd.DataFrame: frame_fingerprint})
 def aggregate_by_species(df: pd.DataFrame) -> pd.DataFrame:
     """
     Aggregate records by species.
@@ -246,15 +415,16 @@ def aggregate_by_species(df: pd.DataFrame) -> pd.DataFrame:
     if df.empty:
         return pd.DataFrame()
     
-    agg_df = df.groupby('Species.Name')['Records'].agg([
-        ('Total_Records', 'sum'),
-        ('Num_Grids', lambda x: df.loc[x.index, 'Grid'].nunique()),
-        ('Num_Sources', lambda x: df.loc[x.index, 'Data.Source'].nunique())
-    ]).reset_index()
+    agg_df = df.groupby('Species.Name', observed=True).agg(
+        Total_Records=('Records', 'sum'),
+        Num_Grids=('Grid', 'nunique'),
+        Num_Sources=('Data.Source', 'nunique')
+    ).reset_index()
     
     return agg_df.sort_values('Total_Records', ascending=False)
 
 
+@st.cache_data(ttl=3600, max_entries=32, show_spinner=False, hash_funcs={pd.DataFrame: frame_fingerprint})
 def aggregate_by_grid(df: pd.DataFrame) -> pd.DataFrame:
     """
     Aggregate records by UTM grid.
@@ -268,15 +438,16 @@ def aggregate_by_grid(df: pd.DataFrame) -> pd.DataFrame:
     if df.empty:
         return pd.DataFrame()
     
-    agg_df = df.groupby('Grid')['Records'].agg([
-        ('Total_Records', 'sum'),
-        ('Num_Species', lambda x: df.loc[x.index, 'Species.Name'].nunique()),
-        ('Num_Sources', lambda x: df.loc[x.index, 'Data.Source'].nunique())
-    ]).reset_index()
+    agg_df = df.groupby('Grid', observed=True).agg(
+        Total_Records=('Records', 'sum'),
+        Num_Species=('Species.Name', 'nunique'),
+        Num_Sources=('Data.Source', 'nunique')
+    ).reset_index()
     
     return agg_df.sort_values('Total_Records', ascending=False)
 
 
+@st.cache_data(ttl=3600, max_entries=32, show_spinner=False, hash_funcs={pd.DataFrame: frame_fingerprint})
 def aggregate_by_source(df: pd.DataFrame) -> pd.DataFrame:
     """
     Aggregate records by data source.
@@ -290,15 +461,116 @@ def aggregate_by_source(df: pd.DataFrame) -> pd.DataFrame:
     if df.empty:
         return pd.DataFrame()
     
-    agg_df = df.groupby('Data.Source')['Records'].agg([
-        ('Total_Records', 'sum'),
-        ('Num_Species', lambda x: df.loc[x.index, 'Species.Name'].nunique()),
-        ('Num_Grids', lambda x: df.loc[x.index, 'Grid'].nunique())
-    ]).reset_index()
+    agg_df = df.groupby('Data.Source', observed=True).agg(
+        Total_Records=('Records', 'sum'),
+        Num_Species=('Species.Name', 'nunique'),
+        Num_Grids=('Grid', 'nunique')
+    ).reset_index()
     
     return agg_df.sort_values('Total_Records', ascending=False)
 
 
+def _group_nunique(keys: pd.Series, values: pd.Series) -> pd.Series:
+    """
+    Count distinct values per key using integer codes.
+    
+    Both columns are factorized once and each distinct (key, value) pair is
+    counted with np.unique/np.bincount, avoiding per-group string hashing.
+    
+    Args:
+        keys: Grouping column
+        values: Column whose distinct values are counted
+        
+    Returns:
+        pd.Series: Distinct value counts indexed by observed key, in sorted order
+    """
+    key_codes, key_uniques = pd.factorize(keys, sort=True)
+    value_codes, value_uniques = pd.factorize(values)
+    
+    # Missing keys or values are coded -1 and excluded, as in nunique()
+    valid = (key_codes >= 0) & (value_codes >= 0)
+    pairs = key_codes[valid].astype(np.int64) * len(value_uniques) + value_codes[valid]
+    counts = np.bincount(np.unique(pairs) // max(len(value_uniques), 1), minlength=len(key_uniques))
+    
+    return pd.Series(counts, index=pd.Index(key_uniques, name=keys.name), name=values.name)
+
+
+@st.cache_data(ttl=3600, max_entries=32, show_spinner=False, hash_funcs={pd.DataFrame: frame_fingerprint})
+def get_source_summary(df: pd.DataFrame) -> pd.DataFrame:
+    """
+    Summarise total records and species richness per data source.
+    
+    Args:
+        df: Input DataFrame with Records column
+        
+    Returns:
+        pd.DataFrame: Source, Total Records and Unique Species columns
+    """
+    if df.empty:
+        return pd.DataFrame(columns=['Source', 'Total Records', 'Unique Species'])
+    
+    # Dedicated sum kernel plus a code-based distinct count instead of one
+    # mixed .agg() call
+    total_records = df.groupby('Data.Source', observed=True)['Records'].sum()
+    unique_species = _group_nunique(df['Data.Source'], df['Species.Name'])
+    
+    return pd.DataFrame({
+        'Source': total_records.index.to_numpy(),
+        'Total Records': total_records.to_numpy(),
+        'Unique Species': unique_species.reindex(total_records.index).to_numpy()
+    })
+
+
+def top_value_counts(series: pd.Series, label: str, top_n: int = 10) -> pd.DataFrame:
+    """
+    Count the most frequent values of a column in a single NumPy pass.
+    
+    Args:
+        series: Column to count (missing values are ignored)
+        label: Name for the value column in the result
+        top_n: Number of most frequent values to keep
+        
+    Returns:
+        pd.DataFrame: Columns [label, 'Records'] sorted by descending count
+    """
+    values, counts = np.unique(series.dropna().to_numpy(), return_counts=True)
+    top = np.argsort(-counts, kind='stable')[:top_n]
+    return pd.DataFrame({label: values[top], 'Records': counts[top]})
+
+
+@st.cache_data(ttl=3600, max_entries=16, show_spinner=False)
+def yearly_record_counts(years: np.ndarray, recent: int = 5) -> Tuple[pd.DataFrame, pd.DataFrame]:
+    """
+    Count records per year with their running total.
+    
+    Args:
+        years: Whole-number year of each record (missing values are ignored)
+        recent: Number of latest years in the summary table
+        
+    Returns:
+        Tuple of ('Records' and 'Cumulative' columns indexed by ascending 'year',
+        the last `recent` rows with 'year' as a column for display)
+    """
+    years = years[~pd.isna(years)]
+    if len(years) == 0:
+        values, counts = years, np.zeros(0, dtype=np.int64)
+    else:
+        # Years span a small integer range, so a bincount replaces sorting
+        offsets = years.astype(np.int64)
+        first = offsets.min()
+        counts = np.bincount(offsets - first)
+        present = np.flatnonzero(counts)
+        values = (present + first).astype(years.dtype)
+        counts = counts[present]
+    
+    yearly = pd.DataFrame(
+        {'Records': counts, 'Cumulative': np.cumsum(counts)},
+        index=pd.Index(values, name='year')
+    )
+    return yearly, yearly.tail(recent).reset_index()
+
+
+@st.cache_data(ttl=3600, max_entries=32, show_spinner=False, hash_funcs={pd.DataFrame: frame_fingerprint})
 def get_correlation_data(df: pd.DataFrame) -> Tuple[pd.DataFrame, float]:
     """
     Prepare data for Daily vs Sequences correlation analysis.
@@ -309,29 +581,265 @@ def get_correlation_data(df: pd.DataFrame) -> Tuple[pd.DataFrame, float]:
     Returns:
         Tuple of (correlation DataFrame, Pearson r coefficient)
     """
-    # Separate by source type
-    df_daily = df[df['Data.Source'] == 'Daily Record'].groupby('Species.Name')['Records'].sum().reset_index()
-    df_daily.rename(columns={'Records': 'Daily_Sum'}, inplace=True)
-    
-    df_sequences = df[df['Data.Source'] == 'Sequences Record'].groupby('Species.Name')['Records'].sum().reset_index()
-    df_sequences.rename(columns={'Records': 'Sequences_Sum'}, inplace=True)
-    
-    # Merge datasets
-    corr_df = pd.merge(df_daily, df_sequences, on='Species.Name', how='outer').fillna(0)
+    # Sum records per species for both source types in a single pivot
+    sources = ['Daily Record', 'Sequences Record']
+    subset = df[df['Data.Source'].isin(sources)]
+    corr_df = subset.pivot_table(
+        index='Species.Name',
+        columns='Data.Source',
+        values='Records',
+        aggfunc='sum',
+        fill_value=0,
+        observed=True
+    )
+    corr_df = corr_df.reindex(columns=sources, fill_value=0)
+    corr_df.columns = ['Daily_Sum', 'Sequences_Sum']
+    corr_df = corr_df.reset_index()
     
     # Calculate Pearson correlation
     if len(corr_df) > 1:
-        correlation = corr_df[['Daily_Sum', 'Sequences_Sum']].corr(method='pearson').iloc[0, 1]
+        # Constant columns have no defined correlation; report 0.0 instead of NaN
+        with np.errstate(divide='ignore', invalid='ignore'):
+            correlation = float(np.corrcoef(
+                corr_df['Daily_Sum'].to_numpy(dtype=float),
+                corr_df['Sequences_Sum'].to_numpy(dtype=float)
+            )[0, 1])
+        if np.isnan(correlation):
+            correlation = 0.0
     else:
         correlation = 0.0
     
     return corr_df, correlation
 
 
+def _chart_value_dtype(records: pd.Series) -> type:
+    """
+    Pick the compact dtype for chart totals of a Records column.
+    
+    Args:
+        records: Records column the totals are summed from
+        
+    Returns:
+        type: np.int32 for whole counts, np.float32 when _clean_records kept
+        fractional values (so totals are neither truncated nor rounded)
+    """
+    return np.int32 if pd.api.types.is_integer_dtype(records) else np.float32
+
+
+@st.cache_data(ttl=3600, max_entries=32, show_spinner=False, hash_funcs={pd.DataFrame: frame_fingerprint})
+def build_stacked_pivot(df: pd.DataFrame, top_n: int = 10) -> pd.DataFrame:
+    """
+    Sum records per species and data source for the top species.
+    
+    Args:
+        df: Input DataFrame with species, sources and records
+        top_n: Number of top species to keep
+        
+    Returns:
+        pd.DataFrame: Species (in name order) × sources recorded for them
+    """
+    # Species × source totals in a single pass, then keep the top species
+    # (in name order) and the sources recorded for them
+    grouped = df.groupby(['Species.Name', 'Data.Source'], observed=True)['Records'].agg(['sum', 'size'])
+    totals = grouped['sum'].unstack(fill_value=0)
+    present = grouped['size'].unstack(fill_value=0) > 0
+    top_species = totals.sum(axis=1).nlargest(top_n).index
+    rows = totals.index.isin(top_species)
+    
+    pivot_df = totals.loc[rows, present[rows].any(axis=0).to_numpy()]
+    
+    return pivot_df.astype(_chart_value_dtype(df['Records']))
+
+
+@st.cache_data(ttl=3600, max_entries=32, show_spinner=False, hash_funcs={pd.DataFrame: frame_fingerprint})
+def build_species_grid_pivot(df: pd.DataFrame, top_n: int = 15) -> pd.DataFrame:
+    """
+    Sum records per species and UTM grid for the top species.
+    
+    Args:
+        df: Input DataFrame with species, grids and records
+        top_n: Number of top species to keep
+        
+    Returns:
+        pd.DataFrame: Species (in name order) × grids where they occur
+    """
+    # Species × grid totals in one pass over the integer codes
+    species_codes, species = pd.factorize(df['Species.Name'], sort=True)
+    grid_codes, grids = pd.factorize(df['Grid'], sort=True)
+    valid = (species_codes >= 0) & (grid_codes >= 0)
+    cells = species_codes[valid] * len(grids) + grid_codes[valid]
+    records = df['Records'].to_numpy(dtype=float)[valid]
+    shape = (len(species), len(grids))
+    totals = np.bincount(cells, weights=records, minlength=shape[0] * shape[1])
+    totals = totals.reshape(shape)
+    present = np.bincount(cells, minlength=shape[0] * shape[1]).reshape(shape) > 0
+    
+    # Top species by total records (ties keep name order), shown in name order,
+    # and only the grids where those species occur
+    rows = np.sort(np.argsort(-totals.sum(axis=1), kind='stable')[:top_n])
+    cols = np.flatnonzero(present[rows].any(axis=0))
+    values = totals[np.ix_(rows, cols)]
+    
+    # bincount sums in float64; whole counts are rounded back to exact integers
+    value_dtype = _chart_value_dtype(df['Records'])
+    if value_dtype is np.int32:
+        values = values.round()
+    
+    return pd.DataFrame(
+        values.astype(value_dtype),
+        index=pd.Index(np.asarray(species)[rows], name='Species.Name'),
+        columns=pd.Index(np.asarray(grids)[cols], name='Grid')
+    )
+
+
+def _collapse_hierarchy(
+    df: pd.DataFrame,
+    path: List[str],
+    value_col: str,
+    max_children: int
+) -> pd.DataFrame:
+    """
+    Aggregate a hierarchy and cap the number of children under each parent.
+    
+    At every level the children of a parent are ranked by total value; those
+    beyond max_children are merged into a single 'Other' node whose deeper
+    levels are left empty, so the sunburst sector count stays bounded.
+    
+    Args:
+        df: Input DataFrame
+        path: Hierarchy columns from root to leaf
+        value_col: Column summed as the sector value
+        max_children: Maximum number of children kept per parent
+        
+    Returns:
+        pd.DataFrame: One row per leaf with path columns and value_col
+    """
+    agg = df.groupby(path, observed=True, sort=False)[value_col].sum().reset_index()
+    agg[path] = agg[path].astype(object)
+    
+    for depth, level in enumerate(path):
+        keys = path[:depth + 1]
+        nodes = agg[agg[level].notna()].groupby(keys, sort=False)[value_col].sum()
+        ranks = (
+            nodes.groupby(level=list(range(depth)), sort=False).rank(method='first', ascending=False)
+            if depth else nodes.rank(method='first', ascending=False)
+        )
+        collapsed = ranks.index[ranks.to_numpy() > max_children]
+        if collapsed.empty:
+            continue
+        
+        row_keys = pd.MultiIndex.from_frame(agg[keys]) if depth else pd.Index(agg[level])
+        mask = row_keys.isin(collapsed)
+        agg.loc[mask, level] = 'Other'
+        agg.loc[mask, path[depth + 1:]] = None
+        agg = agg.groupby(path, dropna=False, sort=False)[value_col].sum().reset_index()
+    
+    return agg
+
+
+def _count_sectors(agg: pd.DataFrame, path: List[str]) -> int:
+    """
+    Count the distinct sunburst sectors described by a collapsed hierarchy.
+    
+    Args:
+        agg: Output of _collapse_hierarchy
+        path: Hierarchy columns from root to leaf
+        
+    Returns:
+        int: Number of nodes across all levels
+    """
+    return sum(
+        len(agg.loc[agg[path[depth]].notna(), path[:depth + 1]].drop_duplicates())
+        for depth in range(len(path))
+    )
+
+
+@st.cache_data(ttl=3600, max_entries=32, show_spinner=False, hash_funcs={pd.DataFrame: frame_fingerprint})
+def build_sunburst_agg(
+    df: pd.DataFrame,
+    max_children: int = 20,
+    max_segments: int = CHART_CONFIG['max_sunburst_segments']
+) -> pd.DataFrame:
+    """
+    Aggregate records along the Grid → Species → Source hierarchy.
+    
+    Args:
+        df: Input DataFrame with Grid, Species.Name, Data.Source
+        max_children: Children kept per parent before the rest become 'Other'
+        max_segments: Upper bound on the total number of sunburst sectors; the
+            per-parent limit is lowered until the hierarchy fits
+        
+    Returns:
+        pd.DataFrame: One row per sunburst leaf with the path columns and Records
+    """
+    path = ['Grid', 'Species.Name', 'Data.Source']
+    
+    # Collapse from the leaf totals so each retry only touches the small table
+    leaves = df.groupby(path, observed=True, sort=False)['Records'].sum().reset_index()
+    
+    sunburst_data = _collapse_hierarchy(leaves, path, 'Records', max_children)
+    if _count_sectors(sunburst_data, path) <= max_segments:
+        return sunburst_data
+    
+    # Binary search for the largest per-parent limit that fits (the sector
+    # count only grows with the limit); a limit of 1 is the fallback
+    low, high = 1, max_children - 1
+    best = _collapse_hierarchy(leaves, path, 'Records', 1)
+    while low <= high:
+        mid = (low + high) // 2
+        candidate = _collapse_hierarchy(leaves, path, 'Records', mid)
+        if _count_sectors(candidate, path) <= max_segments:
+            best, low = candidate, mid + 1
+        else:
+            high = mid - 1
+    
+    return best
+
+
+@st.cache_data(
+    ttl=3600, max_entries=16, show_spinner=False,
+    hash_funcs={pd.DataFrame: frame_fingerprint, gpd.GeoDataFrame: frame_fingerprint}
+)
+def build_temporal_counts(df: pd.DataFrame, time_col: str = 'year', group_col: str = 'order') -> pd.DataFrame:
+    """
+    Count records per time step and group, with a running total per group.
+    
+    Args:
+        df: Input DataFrame with temporal column
+        time_col: Column name for time axis
+        group_col: Column for grouping (e.g., 'order', 'genus')
+        
+    Returns:
+        pd.DataFrame: Columns [time_col, group_col, 'records', 'cumulative'],
+        or an empty DataFrame if either column is missing
+    """
+    if time_col not in df.columns or group_col not in df.columns:
+        return pd.DataFrame()
+    
+    # Kept sorted: the cumulative sum and the line traces both rely on time order
+    temporal = df.groupby([time_col, group_col], observed=True).size().reset_index(name='records')
+    
+    # Running total per group: a stable sort by group keeps each group's rows in
+    # time order, so one cumsum minus the total reached before each group starts
+    # gives the per-group sums without a grouped cumsum
+    codes, _ = pd.factorize(temporal[group_col])
+    order = np.argsort(codes, kind='stable')
+    records = temporal['records'].to_numpy(dtype=np.int64)[order]
+    running = records.cumsum()
+    starts = np.r_[True, codes[order][1:] != codes[order][:-1]]
+    offset = np.maximum.accumulate(np.where(starts, running - records, 0))
+    cumulative = np.empty_like(running)
+    cumulative[order] = running - offset
+    temporal['cumulative'] = cumulative
+    
+    return temporal
+
+
 # ============================================================================
 # SUMMARY STATISTICS
 # ============================================================================
 
+@st.cache_data(ttl=3600, hash_funcs={pd.DataFrame: frame_fingerprint})
 def get_summary_stats(df: pd.DataFrame) -> Dict:
     """
     Calculate comprehensive summary statistics.
@@ -351,23 +859,119 @@ def get_summary_stats(df: pd.DataFrame) -> Dict:
             'species_richness_by_source': {}
         }
     
+    # One groupby per key; totals and unique counts are derived from the
+    # grouped results instead of rescanning the columns
+    source_agg = df.groupby('Data.Source', observed=True).agg(
+        Records=('Records', 'sum'),
+        Species=('Species.Name', 'nunique')
+    )
+    species_totals = df.groupby('Species.Name', observed=True)['Records'].sum()
+    grid_totals = (
+        df.groupby('Grid', observed=True)['Records'].sum()
+        if 'Grid' in df.columns else pd.Series(dtype=float)
+    )
+    
     stats = {
-        'total_records': int(df['Records'].sum()),
-        'unique_species': df['Species.Name'].nunique(),
-        'unique_grids': df['Grid'].nunique() if 'Grid' in df.columns else 0,
-        'unique_sources': df['Data.Source'].nunique(),
-        'species_richness_by_source': df.groupby('Data.Source')['Species.Name'].nunique().to_dict(),
-        'top_species': df.groupby('Species.Name')['Records'].sum().nlargest(5).to_dict(),
-        'top_grids': df.groupby('Grid')['Records'].sum().nlargest(5).to_dict() if 'Grid' in df.columns else {}
+        'total_records': int(source_agg['Records'].sum()),
+        'unique_species': len(species_totals),
+        'unique_grids': len(grid_totals),
+        'unique_sources': len(source_agg),
+        'species_richness_by_source': source_agg['Species'].to_dict(),
+        'top_species': species_totals.nlargest(5).to_dict(),
+        'top_grids': grid_totals.nlargest(5).to_dict()
     }
     
     return stats
 
 
+def describe_with_skew(values: pd.Series) -> Tuple[pd.Series, float]:
+    """
+    Compute describe()-style statistics and skewness with one sort plus
+    vectorized moments.
+    
+    The sorted array provides min, max and the linearly interpolated
+    quartiles; one array of deviations from the mean provides the standard
+    deviation and the (bias-adjusted) skewness, matching Series.describe()
+    and Series.skew().
+    
+    Args:
+        values: Numeric Series (missing values are ignored)
+        
+    Returns:
+        Tuple of (statistics Series indexed like describe(), skewness)
+    """
+    index = ['count', 'mean', 'std', 'min', '25%', '50%', '75%', 'max']
+    x = np.sort(values.dropna().to_numpy(dtype=np.float64))
+    n = x.size
+    
+    if n == 0:
+        stats = [0.0] + [np.nan] * 7
+        return pd.Series(stats, index=index, name=values.name), np.nan
+    
+    mean = x.sum() / n
+    deviations = x - mean
+    squared = deviations * deviations
+    m2 = squared.sum()
+    m3 = (squared * deviations).sum()
+    
+    # Zero out floating point noise on (near) constant input, as pandas does
+    max_abs = max(abs(x[0]), abs(x[-1]))
+    eps = np.finfo(np.float64).eps
+    if abs(m2) <= ((eps * max_abs) ** 2) * n:
+        m2 = 0.0
+    if abs(m3) <= ((eps * max_abs) ** 3) * n:
+        m3 = 0.0
+    
+    std = np.sqrt(m2 / (n - 1)) if n > 1 else np.nan
+    if n < 3:
+        skew = np.nan
+    elif m2 == 0:
+        skew = 0.0
+    else:
+        skew = float(n * (n - 1) ** 0.5 / (n - 2) * (m3 / m2 ** 1.5))
+    
+    # Quartiles straight from the sorted array, interpolated like np.quantile
+    pos = np.array([0.25, 0.5, 0.75]) * (n - 1)
+    lower = np.floor(pos).astype(np.intp)
+    upper = np.minimum(lower + 1, n - 1)
+    frac = pos - lower
+    low_vals, high_vals = x[lower], x[upper]
+    step = high_vals - low_vals
+    q25, q50, q75 = np.where(
+        frac >= 0.5,
+        high_vals - step * (1 - frac),
+        low_vals + step * frac
+    )
+    stats = [float(n), mean, std, x[0], q25, q50, q75, x[-1]]
+    
+    return pd.Series(stats, index=index, name=values.name), skew
+
+
+# ============================================================================
+# EXPORT FUNCTIONS
+# ============================================================================
+
+# Default hashing on purpose: aggregated frames share a RangeIndex, so the
+# row-subset fingerprint used above would not tell them apart.
+@st.cache_data(ttl=3600, max_entries=16, show_spinner=False)
+def dataframe_to_csv_bytes(df: pd.DataFrame) -> bytes:
+    """
+    Encode a DataFrame as CSV bytes for download buttons.
+    
+    Args:
+        df: DataFrame to export
+        
+    Returns:
+        bytes: CSV content without the index
+    """
+    return df.to_csv(index=False).encode(EXPORT_CONFIG['csv_encoding'])
+
+
 # ============================================================================
 # GEOSPATIAL FUNCTIONS
 # ============================================================================
 
+@st.cache_resource(ttl=3600, hash_funcs={pd.DataFrame: frame_fingerprint})
 def create_cameras_geodataframe(cameras_df: pd.DataFrame) -> gpd.GeoDataFrame:
     """
     Convert camera DataFrame to GeoDataFrame.
@@ -378,18 +982,98 @@ def create_cameras_geodataframe(cameras_df: pd.DataFrame) -> gpd.GeoDataFrame:
     Returns:
         gpd.GeoDataFrame: Camera locations as GeoDataFrame
     """
-    from shapely.geometry import Point
-    
-    geometry = [Point(xy) for xy in zip(cameras_df['Longitude'], cameras_df['Latitude'])]
+    geometry = gpd.points_from_xy(cameras_df['Longitude'], cameras_df['Latitude'])
     gdf = gpd.GeoDataFrame(cameras_df, geometry=geometry, crs="EPSG:4326")
     
     return gdf
 
 
+@st.cache_data(ttl=3600, show_spinner=False)
+def get_utm_grid_geojson() -> str:
+    """
+    Serialize the UTM grid to a compact GeoJSON string for map layers.
+    
+    Walking __geo_interface__ builds nested Python dicts for every vertex,
+    so the string is built once and reused by every map render. The string
+    is inlined into each map page, so it keeps only the cell code and snaps
+    vertices to ~1 m (1e-5 degrees), roughly halving its size.
+    
+    Returns:
+        str: GeoJSON FeatureCollection of the UTM grid cells
+    """
+    utm_gdf = load_utm_grid()
+    if utm_gdf.empty or 'geometry' not in utm_gdf.columns:
+        return json.dumps({'type': 'FeatureCollection', 'features': []})
+    
+    columns = [col for col in ['CUADRICULA'] if col in utm_gdf.columns] + ['geometry']
+    grid = utm_gdf[columns].copy()
+    grid['geometry'] = grid.geometry.set_precision(1e-5)
+    
+    return json.dumps(grid.__geo_interface__, separators=(',', ':'))
+
+
+@st.cache_data(ttl=3600, show_spinner=False)
+def get_gbif_heat_raster() -> Tuple[Optional[np.ndarray], Optional[list]]:
+    """
+    Render GBIF occurrence density to an RGBA raster for an image overlay.
+    
+    Points are binned with a 2D histogram, smoothed with a Gaussian filter and
+    colour-mapped once, so the map ships a fixed-size PNG instead of every
+    coordinate for Leaflet.heat to rasterize in the browser. Points outside
+    valid longitude/latitude ranges are ignored.
+    
+    Returns:
+        Tuple of (RGBA uint8 array with north at row 0, [[south, west], [north, east]]
+        bounds), or (None, None) if there are no valid points
+    """
+    gbif_gdf = load_gbif_data()
+    if gbif_gdf.empty or 'geometry' not in gbif_gdf.columns:
+        return None, None
+    
+    points = gbif_gdf.geometry[gbif_gdf.geometry.notna()]
+    lons = points.x.to_numpy()
+    lats = points.y.to_numpy()
+    valid = (np.abs(lons) <= 180) & (np.abs(lats) <= 90)
+    lons, lats = lons[valid], lats[valid]
+    if len(lons) == 0:
+        return None, None
+    
+    # Pad the extent so the blur is not clipped at the edges
+    pad_lon = max(np.ptp(lons) * 0.05, 0.01)
+    pad_lat = max(np.ptp(lats) * 0.05, 0.01)
+    lon_range = [lons.min() - pad_lon, lons.max() + pad_lon]
+    lat_range = [lats.min() - pad_lat, lats.max() + pad_lat]
+    
+    density, _, _ = np.histogram2d(
+        lats, lons,
+        bins=HEAT_RASTER_CONFIG['bins'],
+        range=[lat_range, lon_range]
+    )
+    density = gaussian_filter(density, HEAT_RASTER_CONFIG['sigma'])
+    # Saturate at the 99th percentile so one hotspot does not wash out the rest
+    ceiling = np.percentile(density[density > 0], 99)
+    density = np.clip(density / ceiling, 0.0, 1.0)
+    
+    stops = np.array(list(HEAT_RASTER_CONFIG['gradient'].keys()))
+    colors = np.array(list(HEAT_RASTER_CONFIG['gradient'].values()))
+    rgba = np.empty(density.shape + (4,), dtype=np.uint8)
+    for channel in range(3):
+        rgba[..., channel] = np.interp(density, stops, colors[:, channel])
+    alpha = np.where(density > HEAT_RASTER_CONFIG['min_density'], np.sqrt(density), 0.0)
+    rgba[..., 3] = alpha * 255
+    image = rgba[::-1]
+    
+    bounds = [[float(lat_range[0]), float(lon_range[0])], [float(lat_range[1]), float(lon_range[1])]]
+    return image, bounds
+
+
+@st.cache_resource(ttl=3600, hash_funcs={gpd.GeoDataFrame: frame_fingerprint})
 def spatial_join_gbif_grid(gbif_gdf: gpd.GeoDataFrame, utm_gdf: gpd.GeoDataFrame) -> gpd.GeoDataFrame:
     """
     Perform spatial join between GBIF points and UTM grid.
     
+    The result is cached as a shared resource and must not be modified in place.
+    
     Args:
         gbif_gdf: GBIF occurrence GeoDataFrame
         utm_gdf: UTM grid GeoDataFrame
@@ -401,6 +1085,9 @@ def spatial_join_gbif_grid(gbif_gdf: gpd.GeoDataFrame, utm_gdf: gpd.GeoDataFrame
     if gbif_gdf.crs != utm_gdf.crs:
         gbif_gdf = gbif_gdf.to_crs(utm_gdf.crs)
     
+    # Build the grid's spatial index up front so the join queries a ready tree
+    _ = utm_gdf.sindex  # build the R-tree once
+    
     # Spatial join
     joined = gpd.sjoin(gbif_gdf, utm_gdf, how="left", predicate="within")
     
@@ -411,9 +1098,10 @@ def spatial_join_gbif_grid(gbif_gdf: gpd.GeoDataFrame, utm_gdf: gpd.GeoDataFrame
 # VISUALIZATION ASSETS MANAGEMENT
 # ============================================================================
 
+@st.cache_data(ttl=300, show_spinner=False)
 def check_generated_image(image_key: str) -> bool:
     """
-    Check if a generated image exists.
+    Check if a generated image exists; cached for five minutes.
     
     Args:
         image_key: Key from GENERATED_IMAGES dict
@@ -443,9 +1131,36 @@ def get_generated_image_path(image_key: str) -> Optional[str]:
     return None
 
 
+@st.cache_resource(ttl=300, max_entries=16, show_spinner=False)
+def load_generated_image(image_key: str) -> Optional[bytes]:
+    """
+    Read a generated image into memory for st.image.
+    
+    The bytes are shared across reruns and sessions, so pages do not hit the
+    disk on every interaction; a regenerated image is picked up once the
+    five-minute entry expires.
+    
+    Args:
+        image_key: Key from GENERATED_IMAGES dict
+        
+    Returns:
+        Optional[bytes]: Image file content or None
+    """
+    image_path = get_generated_image_path(image_key)
+    if image_path is None:
+        return None
+    
+    try:
+        with open(image_path, 'rb') as f:
+            return f.read()
+    except OSError:
+        return None
+
+
+@st.cache_data(ttl=300, show_spinner=False)
 def check_generated_map(map_key: str) -> bool:
     """
-    Check if a generated HTML map exists.
+    Check if a generated HTML map exists; cached for five minutes.
     
     Args:
         map_key: Key from GENERATED_MAPS dict
@@ -460,6 +1175,28 @@ def check_generated_map(map_key: str) -> bool:
     return os.path.exists(map_path)
 
 
+@st.cache_resource(ttl=3600, max_entries=4, show_spinner=False)
+def _read_html_map(path: str, mtime: float) -> Optional[str]:
+    """
+    Read an HTML map file; cached per path and modification time.
+    
+    The multi-MB map files are read once and shared across reruns and sessions.
+    Regenerating a map changes its mtime, which invalidates the cached copy.
+    
+    Args:
+        path: Path to the HTML file
+        mtime: File modification time, used only as part of the cache key
+        
+    Returns:
+        Optional[str]: HTML content or None
+    """
+    try:
+        with open(path, 'r', encoding='utf-8') as f:
+            return f.read()
+    except Exception as e:
+        return None
+
+
 def load_html_map(map_key: str) -> Optional[str]:
     """
     Load HTML map content for embedding.
@@ -470,14 +1207,33 @@ def load_html_map(map_key: str) -> Optional[str]:
     Returns:
         Optional[str]: HTML content or None
     """
-    if not check_generated_map(map_key):
+    if map_key not in GENERATED_MAPS:
         return None
     
+    map_path = GENERATED_MAPS[map_key]
     try:
-        with open(GENERATED_MAPS[map_key], 'r', encoding='utf-8') as f:
-            return f.read()
-    except Exception as e:
+        mtime = os.path.getmtime(map_path)
+    except OSError:
         return None
+    
+    return _read_html_map(str(map_path), mtime)
+
+
+def _list_file_names(directory: Path) -> set:
+    """
+    List file names in a directory with a single scandir call.
+    
+    Args:
+        directory: Directory to scan
+        
+    Returns:
+        set: File names in the directory (empty if it does not exist)
+    """
+    try:
+        with os.scandir(directory) as entries:
+            return {entry.name for entry in entries}
+    except OSError:
+        return set()
 
 
 def get_available_visualizations() -> Dict[str, Dict[str, bool]]:
@@ -487,7 +1243,16 @@ def get_available_visualizations() -> Dict[str, Dict[str, bool]]:
     Returns:
         Dict: Status of images and maps
     """
+    img_names = _list_file_names(IMG_DIR)
+    map_names = _list_file_names(HTML_DIR)
+    
     return {
-        'images': {key: check_generated_image(key) for key in GENERATED_IMAGES},
-        'maps': {key: check_generated_map(key) for key in GENERATED_MAPS}
+        'images': {
+            key: path.parent == IMG_DIR and path.name in img_names
+            for key, path in GENERATED_IMAGES.items()
+        },
+        'maps': {
+            key: path.parent == HTML_DIR and path.name in map_names
+            for key, path in GENERATED_MAPS.items()
+        }
     }
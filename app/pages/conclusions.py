@@ -7,6 +7,183 @@ Key findings, recommendations, and actionable insights.
 import streamlit as st
 import pandas as pd
 from styles import create_section_header, create_highlight_box
+from data_loader import get_source_summary
+
+
+# ============================================================================
+# STATIC CONTENT
+# ============================================================================
+# HTML blocks are built once at import instead of on every rerun.
+
+_PAGE_HEADER_HTML = create_section_header(
+    "💡 Key Findings & Recommendations",
+    "Evidence-based insights and strategic recommendations"
+)
+
+_DISTRIBUTION_PATTERNS_HTML = """
+    <div style='background-color: #e3f2fd; padding: 20px; border-radius: 10px; border-left: 5px solid #1976d2;'>
+        <h3 style='color: #1976d2; margin-top: 0;'>📊 Long-Tail Distributions</h3>
+        <p>The data exhibits classic <strong>right-skewed distributions</strong>:</p>
+        <ul>
+            <li>Many species with few records</li>
+            <li>Few species with very high record counts</li>
+            <li>Median significantly lower than mean</li>
+        </ul>
+        <p><strong>Interpretation:</strong> Observation effort naturally concentrates 
+        on common, visible, or charismatic species. This is typical of citizen science 
+        data and reflects both ecological reality and observer behavior.</p>
+    </div>
+"""
+
+_CORRELATION_INSIGHTS_HTML = """
+    <div style='background-color: #e8f5e9; padding: 20px; border-radius: 10px; border-left: 5px solid #388e3c;'>
+        <h3 style='color: #388e3c; margin-top: 0;'>🔗 Correlation Insights</h3>
+        <p>Analysis of <strong>Daily vs Sequences Records</strong> reveals:</p>
+        <ul>
+            <li>Generally positive correlation at species level</li>
+            <li>One or two hyper-abundant species strongly influence trends</li>
+            <li>Underlying pattern clearer when outliers excluded</li>
+        </ul>
+        <p><strong>Implication:</strong> Both recording methods capture similar 
+        patterns, but sensitivity analysis (with/without top species) provides 
+        more nuanced understanding.</p>
+    </div>
+"""
+
+_SPATIAL_FINDINGS_HTML = create_highlight_box("""
+    <h3>Key Spatial Findings</h3>
+
+    <h4>🔥 Hotspots Identified</h4>
+    <ul>
+        <li>Clustered observations tied to specific UTM grids</li>
+        <li>Heat maps reveal recurring high-activity zones</li>
+        <li>Certain grids show exceptional species richness</li>
+    </ul>
+
+    <h4>📍 Coverage Gaps</h4>
+    <ul>
+        <li>Several grids have minimal or no records</li>
+        <li>Geographic sampling bias toward accessible areas</li>
+        <li>Some habitat types under-represented</li>
+    </ul>
+
+    <h4>🎥 Camera Trap Value</h4>
+    <ul>
+        <li>Cameras provide strong local evidence</li>
+        <li>Fill gaps in volunteer platform coverage</li>
+        <li>Enable verification of rare species reports</li>
+    </ul>
+""", 'info')
+
+_PLATFORM_STRENGTHS_HTML = create_highlight_box("""
+    <h3>Platform Strengths & Use Cases</h3>
+
+    <h4>🌍 Global Biodiversity (GBIF)</h4>
+    <ul>
+        <li><strong>Strength:</strong> Long-term historical coverage (2008-2023)</li>
+        <li><strong>Use case:</strong> Baseline comparisons, trend analysis</li>
+        <li><strong>Limitation:</strong> Variable data quality, sparse recent records</li>
+    </ul>
+
+    <h4>📸 Sequences Record (Camera Traps)</h4>
+    <ul>
+        <li><strong>Strength:</strong> Verified observations, temporal detail</li>
+        <li><strong>Use case:</strong> Activity patterns, behavior studies</li>
+        <li><strong>Limitation:</strong> Limited spatial coverage, equipment costs</li>
+    </ul>
+
+    <h4>📅 Daily Record (School Project)</h4>
+    <ul>
+        <li><strong>Strength:</strong> Rapid presence/absence data</li>
+        <li><strong>Use case:</strong> Quick surveys, educational engagement</li>
+        <li><strong>Limitation:</strong> Less temporal detail than sequences</li>
+    </ul>
+
+    <h4>🌐 No Validation (Citizen Science Platforms)</h4>
+    <ul>
+        <li><strong>Strength:</strong> Broad geographic reach, high volume</li>
+        <li><strong>Use case:</strong> Exploration, preliminary patterns</li>
+        <li><strong>Limitation:</strong> Requires validation for formal analyses</li>
+    </ul>
+""", 'success')
+
+_RESEARCH_MONITORING_HTML = create_highlight_box("""
+    <h3>🔬 Research & Monitoring</h3>
+
+    <h4>1. Balance Sampling Effort</h4>
+    <ul>
+        <li>Add cameras to under-sampled grids</li>
+        <li>Relocate equipment from saturated areas</li>
+        <li>Focus volunteer attention on gaps</li>
+    </ul>
+
+    <h4>2. Enhance Data Quality</h4>
+    <ul>
+        <li>Implement validation protocols</li>
+        <li>Provide species ID training</li>
+        <li>Use camera data as verification standard</li>
+    </ul>
+
+    <h4>3. Temporal Expansion</h4>
+    <ul>
+        <li>Extend beyond 4-month sampling window</li>
+        <li>Capture seasonal variation</li>
+        <li>Track year-to-year trends</li>
+    </ul>
+""", 'info')
+
+_EDUCATION_OUTREACH_HTML = create_highlight_box("""
+    <h3>🌱 Education & Outreach</h3>
+
+    <h4>4. Scale Up School Participation</h4>
+    <ul>
+        <li>Recruit additional educational centers</li>
+        <li>Develop standardized curriculum materials</li>
+        <li>Share success stories and results</li>
+    </ul>
+
+    <h4>5. Community Engagement</h4>
+    <ul>
+        <li>Host public data visualization events</li>
+        <li>Create local species guides</li>
+        <li>Establish citizen scientist recognition program</li>
+    </ul>
+
+    <h4>6. Policy Integration</h4>
+    <ul>
+        <li>Share findings with conservation authorities</li>
+        <li>Inform protected area management plans</li>
+        <li>Support evidence-based land use decisions</li>
+    </ul>
+""", 'warning')
+
+_TECHNICAL_ENHANCEMENTS_HTML = create_highlight_box("""
+    <h3>📐 Technical Enhancements</h3>
+
+    <h4>7. Analytical Sophistication</h4>
+    <ul>
+        <li>Implement mixed-effects models for nested data</li>
+        <li>Use occupancy modeling for detection probability</li>
+        <li>Apply spatial autocorrelation tests</li>
+        <li>Develop predictive habitat suitability models</li>
+    </ul>
+
+    <h4>8. Environmental Integration</h4>
+    <ul>
+        <li>Overlay land cover data (agriculture, forest, urban)</li>
+        <li>Incorporate elevation and water proximity</li>
+        <li>Link to protected area boundaries</li>
+        <li>Analyze anthropogenic disturbance factors</li>
+    </ul>
+
+    <h4>9. Temporal Refinement</h4>
+    <ul>
+        <li>Include timestamps for diel activity analysis</li>
+        <li>Align camera events with weather data</li>
+        <li>Track seasonal migration and breeding patterns</li>
+        <li>Develop early warning systems for population declines</li>
+    </ul>
+""", 'highlight')
 
 
 def show_conclusions_page(df: pd.DataFrame):
@@ -18,10 +195,7 @@ def show_conclusions_page(df: pd.DataFrame):
     """
     
     # Page header
-    st.markdown(create_section_header(
-        "💡 Key Findings & Recommendations",
-        "Evidence-based insights and strategic recommendations"
-    ), unsafe_allow_html=True)
+    st.markdown(_PAGE_HEADER_HTML, unsafe_allow_html=True)
     
     # Executive summary
     st.markdown("""
@@ -50,36 +224,10 @@ def show_conclusions_page(df: pd.DataFrame):
         col1, col2 = st.columns(2)
         
         with col1:
-            st.markdown("""
-            <div style='background-color: #e3f2fd; padding: 20px; border-radius: 10px; border-left: 5px solid #1976d2;'>
-                <h3 style='color: #1976d2; margin-top: 0;'>📊 Long-Tail Distributions</h3>
-                <p>The data exhibits classic <strong>right-skewed distributions</strong>:</p>
-                <ul>
-                    <li>Many species with few records</li>
-                    <li>Few species with very high record counts</li>
-                    <li>Median significantly lower than mean</li>
-                </ul>
-                <p><strong>Interpretation:</strong> Observation effort naturally concentrates 
-                on common, visible, or charismatic species. This is typical of citizen science 
-                data and reflects both ecological reality and observer behavior.</p>
-            </div>
-            """, unsafe_allow_html=True)
+            st.markdown(_DISTRIBUTION_PATTERNS_HTML, unsafe_allow_html=True)
         
         with col2:
-            st.markdown("""
-            <div style='background-color: #e8f5e9; padding: 20px; border-radius: 10px; border-left: 5px solid #388e3c;'>
-                <h3 style='color: #388e3c; margin-top: 0;'>🔗 Correlation Insights</h3>
-                <p>Analysis of <strong>Daily vs Sequences Records</strong> reveals:</p>
-                <ul>
-                    <li>Generally positive correlation at species level</li>
-                    <li>One or two hyper-abundant species strongly influence trends</li>
-                    <li>Underlying pattern clearer when outliers excluded</li>
-                </ul>
-                <p><strong>Implication:</strong> Both recording methods capture similar 
-                patterns, but sensitivity analysis (with/without top species) provides 
-                more nuanced understanding.</p>
-            </div>
-            """, unsafe_allow_html=True)
+            st.markdown(_CORRELATION_INSIGHTS_HTML, unsafe_allow_html=True)
         
         st.markdown("### Statistical Recommendations")
         st.markdown("""
@@ -95,30 +243,7 @@ def show_conclusions_page(df: pd.DataFrame):
     with tab2:
         st.markdown("## 🗺️ Spatial Patterns & Hotspots")
         
-        st.markdown(create_highlight_box("""
-        <h3>Key Spatial Findings</h3>
-        
-        <h4>🔥 Hotspots Identified</h4>
-        <ul>
-            <li>Clustered observations tied to specific UTM grids</li>
-            <li>Heat maps reveal recurring high-activity zones</li>
-            <li>Certain grids show exceptional species richness</li>
-        </ul>
-        
-        <h4>📍 Coverage Gaps</h4>
-        <ul>
-            <li>Several grids have minimal or no records</li>
-            <li>Geographic sampling bias toward accessible areas</li>
-            <li>Some habitat types under-represented</li>
-        </ul>
-        
-        <h4>🎥 Camera Trap Value</h4>
-        <ul>
-            <li>Cameras provide strong local evidence</li>
-            <li>Fill gaps in volunteer platform coverage</li>
-            <li>Enable verification of rare species reports</li>
-        </ul>
-        """, 'info'), unsafe_allow_html=True)
+        st.markdown(_SPATIAL_FINDINGS_HTML, unsafe_allow_html=True)
         
         col1, col2 = st.columns(2)
         
@@ -155,46 +280,17 @@ def show_conclusions_page(df: pd.DataFrame):
         st.markdown("## 📊 Data Source Complementarity")
         
         if not df.empty:
-            richness = df.groupby('Data.Source')['Species.Name'].nunique().to_dict()
+            source_summary = get_source_summary(df)
+            sources = source_summary['Source'].to_numpy()
+            counts = source_summary['Unique Species'].to_numpy()
             
             st.markdown("### Species Richness by Platform")
             
-            cols = st.columns(len(richness))
-            for idx, (source, count) in enumerate(richness.items()):
-                with cols[idx]:
-                    st.metric(source, f"{count} species")
-        
-        st.markdown(create_highlight_box("""
-        <h3>Platform Strengths & Use Cases</h3>
+            cols = st.columns(len(sources))
+            for col, source, count in zip(cols, sources, counts):
+                col.metric(str(source), f"{count} species")
         
-        <h4>🌍 Global Biodiversity (GBIF)</h4>
-        <ul>
-            <li><strong>Strength:</strong> Long-term historical coverage (2008-2023)</li>
-            <li><strong>Use case:</strong> Baseline comparisons, trend analysis</li>
-            <li><strong>Limitation:</strong> Variable data quality, sparse recent records</li>
-        </ul>
-        
-        <h4>📸 Sequences Record (Camera Traps)</h4>
-        <ul>
-            <li><strong>Strength:</strong> Verified observations, temporal detail</li>
-            <li><strong>Use case:</strong> Activity patterns, behavior studies</li>
-            <li><strong>Limitation:</strong> Limited spatial coverage, equipment costs</li>
-        </ul>
-        
-        <h4>📅 Daily Record (School Project)</h4>
-        <ul>
-            <li><strong>Strength:</strong> Rapid presence/absence data</li>
-            <li><strong>Use case:</strong> Quick surveys, educational engagement</li>
-            <li><strong>Limitation:</strong> Less temporal detail than sequences</li>
-        </ul>
-        
-        <h4>🌐 No Validation (Citizen Science Platforms)</h4>
-        <ul>
-            <li><strong>Strength:</strong> Broad geographic reach, high volume</li>
-            <li><strong>Use case:</strong> Exploration, preliminary patterns</li>
-            <li><strong>Limitation:</strong> Requires validation for formal analyses</li>
-        </ul>
-        """, 'success'), unsafe_allow_html=True)
+        st.markdown(_PLATFORM_STRENGTHS_HTML, unsafe_allow_html=True)
         
         st.markdown("### Integration Strategy")
         st.info("""
@@ -219,86 +315,14 @@ def show_conclusions_page(df: pd.DataFrame):
         rec1, rec2 = st.columns(2)
         
         with rec1:
-            st.markdown(create_highlight_box("""
-            <h3>🔬 Research & Monitoring</h3>
-            
-            <h4>1. Balance Sampling Effort</h4>
-            <ul>
-                <li>Add cameras to under-sampled grids</li>
-                <li>Relocate equipment from saturated areas</li>
-                <li>Focus volunteer attention on gaps</li>
-            </ul>
-            
-            <h4>2. Enhance Data Quality</h4>
-            <ul>
-                <li>Implement validation protocols</li>
-                <li>Provide species ID training</li>
-                <li>Use camera data as verification standard</li>
-            </ul>
-            
-            <h4>3. Temporal Expansion</h4>
-            <ul>
-                <li>Extend beyond 4-month sampling window</li>
-                <li>Capture seasonal variation</li>
-                <li>Track year-to-year trends</li>
-            </ul>
-            """, 'info'), unsafe_allow_html=True)
+            st.markdown(_RESEARCH_MONITORING_HTML, unsafe_allow_html=True)
         
         with rec2:
-            st.markdown(create_highlight_box("""
-            <h3>🌱 Education & Outreach</h3>
-            
-            <h4>4. Scale Up School Participation</h4>
-            <ul>
-                <li>Recruit additional educational centers</li>
-                <li>Develop standardized curriculum materials</li>
-                <li>Share success stories and results</li>
-            </ul>
-            
-            <h4>5. Community Engagement</h4>
-            <ul>
-                <li>Host public data visualization events</li>
-                <li>Create local species guides</li>
-                <li>Establish citizen scientist recognition program</li>
-            </ul>
-            
-            <h4>6. Policy Integration</h4>
-            <ul>
-                <li>Share findings with conservation authorities</li>
-                <li>Inform protected area management plans</li>
-                <li>Support evidence-based land use decisions</li>
-            </ul>
-            """, 'warning'), unsafe_allow_html=True)
+            st.markdown(_EDUCATION_OUTREACH_HTML, unsafe_allow_html=True)
         
         st.markdown("---")
         
-        st.markdown(create_highlight_box("""
-        <h3>📐 Technical Enhancements</h3>
-        
-        <h4>7. Analytical Sophistication</h4>
-        <ul>
-            <li>Implement mixed-effects models for nested data</li>
-            <li>Use occupancy modeling for detection probability</li>
-            <li>Apply spatial autocorrelation tests</li>
-            <li>Develop predictive habitat suitability models</li>
-        </ul>
-        
-        <h4>8. Environmental Integration</h4>
-        <ul>
-            <li>Overlay land cover data (agriculture, forest, urban)</li>
-            <li>Incorporate elevation and water proximity</li>
-            <li>Link to protected area boundaries</li>
-            <li>Analyze anthropogenic disturbance factors</li>
-        </ul>
-        
-        <h4>9. Temporal Refinement</h4>
-        <ul>
-            <li>Include timestamps for diel activity analysis</li>
-            <li>Align camera events with weather data</li>
-            <li>Track seasonal migration and breeding patterns</li>
-            <li>Develop early warning systems for population declines</li>
-        </ul>
-        """, 'highlight'), unsafe_allow_html=True)
+        st.markdown(_TECHNICAL_ENHANCEMENTS_HTML, unsafe_allow_html=True)
     
     st.markdown("---")
     
@@ -4,28 +4,29 @@ Data Exploration Page
 Interactive data exploration with tables, summaries, and basic visualizations.
 """
 
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
 import streamlit as st
 import pandas as pd
+import numpy as np
+import geopandas as gpd
 import folium
-from folium.plugins import MarkerCluster, HeatMap
-try:
-    from streamlit_folium import folium_static
-except ImportError:
-    # Fallback if streamlit_folium not installed
-    def folium_static(map_obj, width=None, height=None):
-        st.components.v1.html(map_obj._repr_html_(), width=width, height=height, scrolling=True)
+from folium.plugins import FastMarkerCluster
+from streamlit.runtime.scriptrunner import add_script_run_ctx, get_script_run_ctx
 
 from styles import create_section_header, create_highlight_box
 from data_loader import (
-    aggregate_by_species, aggregate_by_grid, aggregate_by_source,
-    create_cameras_geodataframe, spatial_join_gbif_grid,
-    load_html_map, check_generated_map
+    aggregate_by_species, aggregate_by_grid,
+    get_source_summary, top_value_counts, yearly_record_counts, dataframe_to_csv_bytes,
+    create_cameras_geodataframe, spatial_join_gbif_grid, get_utm_grid_geojson,
+    get_gbif_heat_raster, load_html_map, check_generated_map
 )
 from visualizations import (
     plot_records_pie_by_source, plot_records_by_species,
-    plot_records_by_grid
+    plot_records_by_grid, plot_yearly_records
 )
-from config import MAP_CONFIG, PLATFORM_COLORS
+from config import MAP_CONFIG, HEAT_RASTER_CONFIG, PLATFORM_COLORS, CS_DISPLAY_COLUMNS, GBIF_DISPLAY_COLUMNS
 
 
 def show_data_exploration_page(df: pd.DataFrame, data: dict):
@@ -49,36 +50,107 @@ def show_data_exploration_page(df: pd.DataFrame, data: dict):
     
     st.markdown("---")
     
-    # Tabs organized by data source
-    tab1, tab2, tab3, tab4 = st.tabs([
-        "📊 Citizen Science Data",
-        "🌍 GBIF Analysis", 
-        "🗺️ UTM Grid Patterns",
-        "🔗 Integrated Maps"
-    ])
-    
-    # TAB 1: Citizen Science Data (dataset_CSsources_mod.csv)
-    with tab1:
-        show_citizen_science_tab(df, data)
-    
-    # TAB 2: GBIF Data (GBIFdata_CO.shp)
-    with tab2:
-        show_gbif_tab(df, data)
-    
-    # TAB 3: UTM Grid Analysis (CO_UTM2.shp)
-    with tab3:
-        show_utm_grid_tab(df, data)
-    
-    # TAB 4: Integrated Maps
-    with tab4:
-        show_integrated_maps_tab(df, data)
+    # Shared aggregations, computed once per rerun and handed to every section
+    aggregates = _compute_aggregates(df)
+    
+    # Section selector organized by data source. Unlike st.tabs, only the
+    # selected section's body is executed on each rerun.
+    sections = {
+        "📊 Citizen Science Data": show_citizen_science_tab,   # dataset_CSsources_mod.csv
+        "🌍 GBIF Analysis": show_gbif_tab,                     # GBIFdata_CO.shp
+        "🗺️ UTM Grid Patterns": show_utm_grid_tab,             # CO_UTM2.shp
+        "🔗 Integrated Maps": show_integrated_maps_tab
+    }
+    
+    selected_section = st.radio(
+        "Data source:",
+        options=list(sections),
+        horizontal=True,
+        label_visibility="collapsed",
+        key='explore_tab'
+    )
+    
+    sections[selected_section](df, data, aggregates)
+
+
+def _compute_aggregates(df: pd.DataFrame) -> dict:
+    """
+    Build the per-species, per-grid and per-source aggregations used by the tabs.
+    
+    Args:
+        df: Filtered citizen science DataFrame
+        
+    Returns:
+        dict: 'species', 'grid' and 'source' summary DataFrames
+    """
+    builders = {
+        'species': aggregate_by_species,
+        'grid': aggregate_by_grid,
+        'source': get_source_summary
+    }
+    
+    # The groupby kernels release the GIL, so the independent reductions
+    # overlap in threads. Workers share the script context for the caches.
+    ctx = get_script_run_ctx()
+    with ThreadPoolExecutor(
+        max_workers=len(builders),
+        initializer=lambda: add_script_run_ctx(threading.current_thread(), ctx)
+    ) as executor:
+        futures = {key: executor.submit(builder, df) for key, builder in builders.items()}
+        return {key: future.result() for key, future in futures.items()}
 
 
 # ============================================================================
 # TAB 1: CITIZEN SCIENCE DATA
 # ============================================================================
 
-def show_citizen_science_tab(df: pd.DataFrame, data: dict):
+def _set_cs_page(page: int):
+    """Store the current page of the raw citizen science table."""
+    st.session_state['cs_page'] = max(page, 0)
+
+
+@st.fragment
+def _cs_table_fragment(df: pd.DataFrame):
+    """
+    Render the paginated raw citizen science table.
+    
+    Runs as a fragment so paging and page-size changes rerun only the table,
+    not the whole page.
+    
+    Args:
+        df: Filtered citizen science DataFrame
+    """
+    # Display options (changing the page size returns to the first page)
+    show_rows = st.selectbox(
+        "Show rows:", [10, 25, 50, 100, 500], index=1, key='cs_rows',
+        on_change=_set_cs_page, args=(0,)
+    )
+    
+    # Clamp the stored page in case the filtered dataset shrank
+    n_pages = max(1, -(-len(df) // show_rows))
+    page = min(st.session_state.get('cs_page', 0), n_pages - 1)
+    start = page * show_rows
+    
+    # Display dataframe (slice rows first so only the shown cells are serialised)
+    st.dataframe(
+        df.iloc[start:start + show_rows][CS_DISPLAY_COLUMNS],
+        use_container_width=True,
+        height=400
+    )
+    
+    # Page navigation
+    prev_col, page_col, next_col = st.columns([1, 2, 1])
+    with prev_col:
+        st.button("◀ Previous", key='cs_prev', disabled=page == 0,
+                  on_click=_set_cs_page, args=(page - 1,))
+    with page_col:
+        st.caption(f"Page {page + 1} of {n_pages}")
+    with next_col:
+        st.button("Next ▶", key='cs_next', disabled=page >= n_pages - 1,
+                  on_click=_set_cs_page, args=(page + 1,))
+
+
+def show_citizen_science_tab(df: pd.DataFrame, data: dict, aggregates: dict):
     """Display Citizen Science data exploration (dataset_CSsources_mod.csv)."""
     
     st.markdown("## 📊 Citizen Science Data Explorer")
@@ -96,18 +168,10 @@ def show_citizen_science_tab(df: pd.DataFrame, data: dict):
         st.markdown("### 📋 Raw Citizen Science Dataset")
         st.markdown("Browse the complete filtered citizen science dataset:")
         
-        # Display options
-        show_rows = st.selectbox("Show rows:", [10, 25, 50, 100, 500], index=1, key='cs_rows')
-        
-        # Display dataframe
-        st.dataframe(
-            df.head(show_rows),
-            use_container_width=True,
-            height=400
-        )
+        _cs_table_fragment(df)
         
         # Download button
-        csv = df.to_csv(index=False).encode('utf-8')
+        csv = dataframe_to_csv_bytes(df)
         st.download_button(
             label="📥 Download Citizen Science CSV",
             data=csv,
@@ -125,11 +189,7 @@ def show_citizen_science_tab(df: pd.DataFrame, data: dict):
         )
         
         # Summary by source
-        source_summary = df.groupby('Data.Source').agg({
-            'Records': 'sum',
-            'Species.Name': 'nunique'
-        }).reset_index()
-        source_summary.columns = ['Source', 'Total Records', 'Unique Species']
+        source_summary = aggregates['source']
         
         st.markdown("#### Source Statistics")
         st.dataframe(source_summary, use_container_width=True, hide_index=True)
@@ -142,7 +202,7 @@ def show_citizen_science_tab(df: pd.DataFrame, data: dict):
     
     with col1:
         st.markdown("#### Top Species by Records")
-        species_agg = aggregate_by_species(df)
+        species_agg = aggregates['species']
         st.plotly_chart(
             plot_records_by_species(species_agg),
             use_container_width=True,
@@ -170,7 +230,7 @@ def show_citizen_science_tab(df: pd.DataFrame, data: dict):
 # TAB 2: GBIF ANALYSIS
 # ============================================================================
 
-def show_gbif_tab(df: pd.DataFrame, data: dict):
+def show_gbif_tab(df: pd.DataFrame, data: dict, aggregates: dict):
     """Display GBIF data exploration (GBIFdata_CO.shp)."""
     
     st.markdown("## 🌍 GBIF Historical Records Analysis")
@@ -219,15 +279,13 @@ def show_gbif_tab(df: pd.DataFrame, data: dict):
     st.markdown("### 📋 GBIF Records Sample")
     
     # Select relevant columns
-    display_cols = []
-    for col in ['genus', 'family', 'order', 'year', 'institut_1', 'CUADRICULA']:
-        if col in gbif_df.columns:
-            display_cols.append(col)
+    available_cols = set(gbif_df.columns)
+    display_cols = [col for col in GBIF_DISPLAY_COLUMNS if col in available_cols]
     
     if display_cols:
         show_rows_gbif = st.selectbox("Show rows:", [10, 25, 50, 100], index=1, key='gbif_rows')
         st.dataframe(
-            gbif_df[display_cols].head(show_rows_gbif),
+            gbif_df.iloc[:show_rows_gbif][display_cols],
             use_container_width=True,
             height=400
         )
@@ -243,40 +301,37 @@ def show_gbif_tab(df: pd.DataFrame, data: dict):
     with col1:
         if 'order' in gbif_df.columns:
             st.markdown("#### Records by Taxonomic Order")
-            order_counts = gbif_df['order'].value_counts().reset_index()
-            order_counts.columns = ['Order', 'Records']
-            st.dataframe(order_counts.head(10), use_container_width=True, hide_index=True)
+            order_counts = top_value_counts(gbif_df['order'], 'Order')
+            st.dataframe(order_counts, use_container_width=True, hide_index=True)
     
     with col2:
         if 'genus' in gbif_df.columns:
             st.markdown("#### Top 10 Genera")
-            genus_counts = gbif_df['genus'].value_counts().reset_index()
-            genus_counts.columns = ['Genus', 'Records']
-            st.dataframe(genus_counts.head(10), use_container_width=True, hide_index=True)
+            genus_counts = top_value_counts(gbif_df['genus'], 'Genus')
+            st.dataframe(genus_counts, use_container_width=True, hide_index=True)
     
     # Temporal trends (if year available)
     if 'year' in gbif_df.columns:
         st.markdown("---")
         st.markdown("### 📅 Temporal Evolution")
         
-        yearly_summary = gbif_df.groupby('year').size().reset_index(name='Records')
-        yearly_summary['Cumulative'] = yearly_summary['Records'].cumsum()
+        yearly_summary, recent_years = yearly_record_counts(gbif_df['year'].to_numpy())
         
         col1, col2 = st.columns([2, 1])
         
         with col1:
-            st.line_chart(yearly_summary.set_index('year')[['Records', 'Cumulative']])
+            st.plotly_chart(plot_yearly_records(yearly_summary), use_container_width=True)
         
         with col2:
             st.markdown("#### Recent Years Summary")
-            st.dataframe(yearly_summary.tail(5), use_container_width=True, hide_index=True)
+            st.dataframe(recent_years, use_container_width=True, hide_index=True)
 
 
 # ============================================================================
 # TAB 3: UTM GRID PATTERNS
 # ============================================================================
 
-def show_utm_grid_tab(df: pd.DataFrame, data: dict):
+def show_utm_grid_tab(df: pd.DataFrame, data: dict, aggregates: dict):
     """Display UTM Grid spatial analysis (CO_UTM2.shp)."""
     
     st.markdown("## 🗺️ UTM Grid Spatial Patterns")
@@ -288,8 +343,8 @@ def show_utm_grid_tab(df: pd.DataFrame, data: dict):
     - Grid-level species composition
     """)
     
-    # Grid-level aggregation
-    grid_agg = aggregate_by_grid(df)
+    # Grid-level aggregation (already sorted by Total_Records, descending)
+    grid_agg = aggregates['grid']
     
     if grid_agg.empty:
         st.warning("⚠️ No grid data available")
@@ -310,7 +365,7 @@ def show_utm_grid_tab(df: pd.DataFrame, data: dict):
         st.metric("Avg Records/Grid", f"{avg_records:.0f}")
     
     with col4:
-        top_grid = grid_agg.nlargest(1, 'Total_Records')['Grid'].values[0]
+        top_grid = grid_agg['Grid'].iat[0]
         st.metric("Richest Grid", top_grid)
     
     # Grid visualization
@@ -328,8 +383,9 @@ def show_utm_grid_tab(df: pd.DataFrame, data: dict):
     with col2:
         st.markdown("#### 🏆 Top 10 Hotspot Grids")
         # Rename columns for display
-        top_grids = grid_agg.nlargest(10, 'Total_Records')[['Grid', 'Total_Records', 'Num_Species']].copy()
-        top_grids.columns = ['Grid', 'Total Records', 'Species Count']
+        top_grids = grid_agg.iloc[:10][['Grid', 'Total_Records', 'Num_Species']].rename(
+            columns={'Total_Records': 'Total Records', 'Num_Species': 'Species Count'}
+        )
         st.dataframe(top_grids, use_container_width=True, hide_index=True)
     
     # Detailed grid table
@@ -337,14 +393,14 @@ def show_utm_grid_tab(df: pd.DataFrame, data: dict):
     st.markdown("### 📋 Complete Grid Summary")
     
     st.dataframe(
-        grid_agg.sort_values('Total_Records', ascending=False),
+        grid_agg,
         use_container_width=True,
         height=400,
         hide_index=True
     )
     
     # Download button
-    csv_grid = grid_agg.to_csv(index=False).encode('utf-8')
+    csv_grid = dataframe_to_csv_bytes(grid_agg)
     st.download_button(
         label="📥 Download Grid Summary CSV",
         data=csv_grid,
@@ -357,18 +413,22 @@ def show_utm_grid_tab(df: pd.DataFrame, data: dict):
     st.markdown("---")
     st.markdown("### 🎯 Sampling Coverage Analysis")
     
+    # Both quantiles in one pass; counts taken straight from the arrays
+    records = grid_agg['Total_Records'].to_numpy()
+    q25, q75 = np.quantile(records, [0.25, 0.75])
+    
     col1, col2, col3 = st.columns(3)
     
     with col1:
-        high_coverage = len(grid_agg[grid_agg['Total_Records'] > grid_agg['Total_Records'].quantile(0.75)])
+        high_coverage = int(np.count_nonzero(records > q75))
         st.metric("High Coverage Grids", high_coverage, help="Grids in top 25% for records")
     
     with col2:
-        low_coverage = len(grid_agg[grid_agg['Total_Records'] < grid_agg['Total_Records'].quantile(0.25)])
+        low_coverage = int(np.count_nonzero(records < q25))
         st.metric("Low Coverage Grids", low_coverage, help="Grids in bottom 25% for records")
     
     with col3:
-        single_species = len(grid_agg[grid_agg['Num_Species'] == 1])
+        single_species = int(np.count_nonzero(grid_agg['Num_Species'].to_numpy() == 1))
         st.metric("Single-Species Grids", single_species, help="Grids with only 1 species recorded")
 
 
@@ -376,7 +436,7 @@ def show_utm_grid_tab(df: pd.DataFrame, data: dict):
 # TAB 4: INTEGRATED MAPS
 # ============================================================================
 
-def show_integrated_maps_tab(df: pd.DataFrame, data: dict):
+def show_integrated_maps_tab(df: pd.DataFrame, data: dict, aggregates: dict):
     """Display integrated interactive maps combining all data sources."""
     
     st.markdown("## 🌍 Integrated Interactive Maps")
@@ -459,98 +519,196 @@ def show_integrated_maps_tab(df: pd.DataFrame, data: dict):
         st.markdown("### 🛠️ Build Your Own Interactive Map")
         st.markdown("Customize map layers and filters to create a personalized view.")
         
-        # Map customization options
-        col1, col2 = st.columns(2)
+        _custom_map_fragment(data)
+
+
+@st.fragment
+def _custom_map_fragment(data: dict):
+    """
+    Render the custom map layer options and builder.
+    
+    Runs as a fragment so toggling layers or generating the map reruns only
+    this section, not the whole page.
+    
+    Args:
+        data: Dictionary with all loaded datasets
+    """
+    # Map customization options
+    col1, col2 = st.columns(2)
+    
+    with col1:
+        show_gbif = st.checkbox("Show GBIF Points", value=True)
+        show_cameras = st.checkbox("Show Camera Traps", value=True)
+        show_grid = st.checkbox("Show UTM Grid", value=True)
+    
+    with col2:
+        show_heat = st.checkbox("Show Heat Layer", value=False)
+        cluster_points = st.checkbox("Cluster Points", value=True)
+    
+    # Build custom map
+    if st.button("🗺️ Generate Custom Map"):
+        if not any([show_gbif, show_cameras, show_grid, show_heat]):
+            st.warning("⚠️ Select at least one layer to generate a map")
+            return
+        
+        st.info("🔄 Generating custom map...")
         
-        with col1:
-            show_gbif = st.checkbox("Show GBIF Points", value=True)
-            show_cameras = st.checkbox("Show Camera Traps", value=True)
-            show_grid = st.checkbox("Show UTM Grid", value=True)
+        try:
+            html_content = _build_custom_map_html(
+                data, show_gbif, show_cameras, show_grid, show_heat, cluster_points
+            )
+            
+            # Display map
+            st.components.v1.html(html_content, width=800, height=600)
+            
+            st.success("✅ Custom map generated successfully!")
+            
+        except Exception as e:
+            st.error(f"❌ Error generating custom map: {str(e)}")
+            st.info("💡 Ensure all data sources are properly loaded and contain valid geometry.")
+
+
+# Leaflet callback for FastMarkerCluster rows of [lat, lon, genus]; mirrors the
+# green 'paw' folium.Icon and "Species: ..." popup of the per-row markers
+_GBIF_MARKER_CALLBACK = """function (row) {
+    var icon = L.AwesomeMarkers.icon({icon: 'paw', prefix: 'fa', markerColor: 'green'});
+    var marker = L.marker(new L.LatLng(row[0], row[1]), {icon: icon});
+    marker.bindPopup('Species: ' + row[2]);
+    return marker;
+}"""
+
+
+def _point_coords(gdf: gpd.GeoDataFrame, label_col: str = None, default_label: str = None):
+    """
+    Extract [lat, lon] pairs and popup labels for all non-null point geometries.
+    
+    Coordinates are read with vectorized GeoSeries.x/.y instead of per-row
+    shapely attribute access.
+    
+    Args:
+        gdf: GeoDataFrame with point geometries
+        label_col: Optional column used for popup labels
+        default_label: Label used when label_col is missing
         
-        with col2:
-            show_heat = st.checkbox("Show Heat Layer", value=False)
-            cluster_points = st.checkbox("Cluster Points", value=True)
+    Returns:
+        tuple: (list of [lat, lon] pairs, list of labels aligned with them)
+    """
+    mask = gdf.geometry.notna().to_numpy()
+    points = gdf.geometry[mask]
+    coords = np.column_stack([points.y.to_numpy(), points.x.to_numpy()]).tolist()
+    
+    if label_col is None:
+        labels = []
+    elif label_col in gdf.columns:
+        labels = gdf[label_col][mask].astype(str).tolist()
+    else:
+        labels = [default_label] * len(coords)
+    
+    return coords, labels
+
+
+@st.cache_data(ttl=3600, max_entries=32, show_spinner=False)
+def _build_custom_map_html(
+    _data: dict,
+    show_gbif: bool,
+    show_cameras: bool,
+    show_grid: bool,
+    show_heat: bool,
+    cluster_points: bool
+) -> str:
+    """
+    Build the custom folium map and return its rendered HTML.
+    
+    The datasets come from the cached loaders and never change between
+    reruns, so only the layer flags form the cache key.
+    
+    Args:
+        _data: Dictionary with all loaded datasets (not hashed)
+        show_gbif: Add GBIF occurrence points
+        show_cameras: Add camera trap markers
+        show_grid: Add the UTM grid overlay
+        show_heat: Add a GBIF heat layer
+        cluster_points: Cluster GBIF points instead of plotting circles
         
-        # Build custom map
-        if st.button("🗺️ Generate Custom Map"):
-            st.info("🔄 Generating custom map...")
+    Returns:
+        str: Map HTML ready for st.components.v1.html
+    """
+    # Create base map
+    center_lat = MAP_CONFIG['center_lat']
+    center_lon = MAP_CONFIG['center_lon']
+    zoom = MAP_CONFIG['default_zoom']
+    
+    custom_map = folium.Map(
+        location=[center_lat, center_lon],
+        zoom_start=zoom,
+        tiles=MAP_CONFIG['tile_layer'],
+        prefer_canvas=True
+    )
+    
+    # Add UTM grid if selected
+    if show_grid and 'utm_grid' in _data:
+        folium.GeoJson(
+            get_utm_grid_geojson(),
+            name="UTM Grid",
+            style_function=lambda x: {
+                'color': 'purple',
+                'weight': 2,
+                'opacity': 0.3,
+                'fillOpacity': 0.05
+            }
+        ).add_to(custom_map)
+    
+    # Add GBIF points
+    if show_gbif and 'gbif' in _data:
+        gbif_df = _data['gbif']
+        
+        if not gbif_df.empty and hasattr(gbif_df, 'geometry'):
+            coords, genera = _point_coords(gbif_df, 'genus', 'Unknown')
             
-            try:
-                # Create base map
-                center_lat = MAP_CONFIG['center_lat']
-                center_lon = MAP_CONFIG['center_lon']
-                zoom = MAP_CONFIG['zoom_start']
-                
-                custom_map = folium.Map(location=[center_lat, center_lon], zoom_start=zoom)
-                
-                # Add UTM grid if selected
-                if show_grid and 'utm_grid' in data:
-                    folium.GeoJson(
-                        data['utm_grid'].__geo_interface__,
-                        name="UTM Grid",
-                        style_function=lambda x: {
-                            'color': 'purple',
-                            'weight': 2,
-                            'opacity': 0.3,
-                            'fillOpacity': 0.05
-                        }
-                    ).add_to(custom_map)
-                
-                # Add GBIF points
-                if show_gbif and 'gbif' in data:
-                    gbif_df = data['gbif']
-                    
-                    if not gbif_df.empty and hasattr(gbif_df, 'geometry'):
-                        if cluster_points:
-                            marker_cluster = MarkerCluster(name="GBIF Records")
-                            
-                            for idx, row in gbif_df.iterrows():
-                                if row.geometry is not None:
-                                    folium.Marker(
-                                        location=[row.geometry.y, row.geometry.x],
-                                        popup=f"Species: {row.get('genus', 'Unknown')}",
-                                        icon=folium.Icon(color='green', icon='paw', prefix='fa')
-                                    ).add_to(marker_cluster)
-                            
-                            marker_cluster.add_to(custom_map)
-                        else:
-                            for idx, row in gbif_df.iterrows():
-                                if row.geometry is not None:
-                                    folium.CircleMarker(
-                                        location=[row.geometry.y, row.geometry.x],
-                                        radius=3,
-                                        color='green',
-                                        fill=True,
-                                        popup=f"Species: {row.get('genus', 'Unknown')}"
-                                    ).add_to(custom_map)
-                
-                # Add heat layer
-                if show_heat and 'gbif' in data:
-                    gbif_df = data['gbif']
-                    if not gbif_df.empty and hasattr(gbif_df, 'geometry'):
-                        heat_data = [[row.geometry.y, row.geometry.x] for idx, row in gbif_df.iterrows() if row.geometry is not None]
-                        if heat_data:
-                            HeatMap(heat_data, radius=15, blur=20, max_zoom=10).add_to(custom_map)
-                
-                # Add cameras
-                if show_cameras and 'cameras' in data:
-                    cameras_gdf = create_cameras_geodataframe(data['cameras'])
-                    if not cameras_gdf.empty:
-                        for idx, row in cameras_gdf.iterrows():
-                            folium.Marker(
-                                location=[row.geometry.y, row.geometry.x],
-                                popup=f"<b>Camera Trap</b><br>{row.get('Nombre.Loc', 'Camera')}",
-                                icon=folium.Icon(color='black', icon='camera', prefix='fa')
-                            ).add_to(custom_map)
-                
-                # Add layer control
-                folium.LayerControl().add_to(custom_map)
-                
-                # Display map
-                folium_static(custom_map, width=800, height=600)
-                
-                st.success("✅ Custom map generated successfully!")
-                
-            except Exception as e:
-                st.error(f"❌ Error generating custom map: {str(e)}")
-                st.info("💡 Ensure all data sources are properly loaded and contain valid geometry.")
+            if cluster_points:
+                # Markers are built in the browser from [lat, lon, genus] rows
+                FastMarkerCluster(
+                    data=[[lat, lon, genus] for (lat, lon), genus in zip(coords, genera)],
+                    callback=_GBIF_MARKER_CALLBACK,
+                    name="GBIF Records"
+                ).add_to(custom_map)
+            else:
+                # One GeoJSON layer drawn on the map canvas instead of one
+                # CircleMarker object (and script block) per point
+                points = gbif_df.loc[gbif_df.geometry.notna(), ['geometry']].assign(genus=genera)
+                folium.GeoJson(
+                    points.to_json(),
+                    name="GBIF Records",
+                    marker=folium.CircleMarker(radius=3, color='green', fill=True),
+                    popup=folium.GeoJsonPopup(fields=['genus'], aliases=['Species:'], labels=True)
+                ).add_to(custom_map)
+    
+    # Add heat layer
+    if show_heat and 'gbif' in _data:
+        heat_image, heat_bounds = get_gbif_heat_raster()
+        if heat_image is not None:
+            folium.raster_layers.ImageOverlay(
+                heat_image,
+                bounds=heat_bounds,
+                opacity=HEAT_RASTER_CONFIG['opacity'],
+                mercator_project=True,
+                pixelated=False,
+                name="GBIF Density"
+            ).add_to(custom_map)
+    
+    # Add cameras
+    if show_cameras and 'cameras' in _data:
+        cameras_gdf = create_cameras_geodataframe(_data['cameras'])
+        if not cameras_gdf.empty:
+            coords, names = _point_coords(cameras_gdf, 'Nombre.Loc', 'Camera')
+            for location, name in zip(coords, names):
+                folium.Marker(
+                    location=location,
+                    popup=f"<b>Camera Trap</b><br>{name}",
+                    icon=folium.Icon(color='black', icon='camera', prefix='fa')
+                ).add_to(custom_map)
+    
+    # Add layer control
+    folium.LayerControl().add_to(custom_map)
+    
+    return custom_map._repr_html_()
@@ -8,12 +8,16 @@ import streamlit as st
 import pandas as pd
 import numpy as np
 from styles import create_section_header, create_highlight_box
-from data_loader import get_correlation_data, check_generated_image, get_generated_image_path
+from data_loader import (
+    get_correlation_data, aggregate_by_source, aggregate_by_grid, describe_with_skew,
+    yearly_record_counts, build_stacked_pivot, build_species_grid_pivot, build_sunburst_agg,
+    build_temporal_counts, check_generated_image, load_generated_image
+)
 from visualizations import (
     plot_dual_histograms, plot_correlation_scatter, plot_correlation_comparison,
     plot_species_richness_by_source, plot_stacked_bar_by_source,
     plot_species_grid_heatmap, plot_records_boxplot_by_source,
-    plot_hierarchical_sunburst, plot_temporal_trends
+    plot_hierarchical_sunburst, plot_temporal_trends, plot_yearly_records
 )
 
 
@@ -92,8 +96,7 @@ def show_distribution_analysis(df):
     # Check if generated image exists
     if check_generated_image('histogram_distributions'):
         st.markdown("### 📊 Generated Distribution Histograms (from EDA Notebook)")
-        image_path = get_generated_image_path('histogram_distributions')
-        st.image(image_path, caption="Distribution of Sequences vs Daily Records", use_container_width=True)
+        st.image(load_generated_image('histogram_distributions'), caption="Distribution of Sequences vs Daily Records", use_container_width=True)
         
         st.markdown("""
         **From the EDA Analysis:**
@@ -107,9 +110,10 @@ def show_distribution_analysis(df):
     # Interactive version
     st.markdown("### 🔄 Interactive Distribution Visualization")
     
-    # Separate data by source type
-    df_sequences = df[df['Data.Source'] == 'Sequences Record']
-    df_daily = df[df['Data.Source'] == 'Daily Record']
+    # Separate data by source type with one pass over the categorical codes
+    source_frames = dict(iter(df.groupby('Data.Source', observed=True)))
+    df_sequences = source_frames.get('Sequences Record', df.iloc[:0])
+    df_daily = source_frames.get('Daily Record', df.iloc[:0])
     
     # Dual histogram
     if not df_sequences.empty and not df_daily.empty:
@@ -124,22 +128,22 @@ def show_distribution_analysis(df):
     with col1:
         st.markdown("### Sequences Record Statistics")
         if not df_sequences.empty:
-            stats_seq = df_sequences['Records'].describe()
+            stats_seq, skew_seq = describe_with_skew(df_sequences['Records'])
             st.dataframe(stats_seq, use_container_width=True)
             
             # Additional metrics
-            st.metric("Skewness", f"{df_sequences['Records'].skew():.2f}")
+            st.metric("Skewness", f"{skew_seq:.2f}")
         else:
             st.info("No sequences records in filtered data")
     
     with col2:
         st.markdown("### Daily Record Statistics")
         if not df_daily.empty:
-            stats_daily = df_daily['Records'].describe()
+            stats_daily, skew_daily = describe_with_skew(df_daily['Records'])
             st.dataframe(stats_daily, use_container_width=True)
             
             # Additional metrics
-            st.metric("Skewness", f"{df_daily['Records'].skew():.2f}")
+            st.metric("Skewness", f"{skew_daily:.2f}")
         else:
             st.info("No daily records in filtered data")
     
@@ -211,15 +215,20 @@ def show_correlation_analysis(df):
     st.markdown("#### Outlier Sensitivity Analysis")
     
     # Identify top species
-    top_species = corr_df.nlargest(1, 'Daily_Sum')['Species.Name'].values[0]
+    top_pos = int(corr_df['Daily_Sum'].to_numpy().argmax())
+    top_species = corr_df['Species.Name'].iat[top_pos]
     
     st.info(f"**Most abundant species (Daily Records):** {top_species}")
     
-    # Correlation without outlier
-    corr_df_filtered = corr_df[corr_df['Species.Name'] != top_species]
+    # Correlation without outlier (species names are unique after the pivot)
+    corr_df_filtered = corr_df.drop(index=corr_df.index[top_pos])
     
     if len(corr_df_filtered) > 1:
-        corr_value_filtered = corr_df_filtered[['Daily_Sum', 'Sequences_Sum']].corr(method='pearson').iloc[0, 1]
+        with np.errstate(divide='ignore', invalid='ignore'):
+            corr_value_filtered = float(np.corrcoef(
+                corr_df_filtered['Daily_Sum'].to_numpy(dtype=float),
+                corr_df_filtered['Sequences_Sum'].to_numpy(dtype=float)
+            )[0, 1])
         
         st.plotly_chart(
             plot_correlation_comparison(corr_df, corr_df_filtered, corr_value, corr_value_filtered, top_species),
@@ -276,8 +285,7 @@ def show_species_richness_analysis(df):
     # Display the comprehensive generated image (more informative than interactive)
     if check_generated_image('species_richness_by_source'):
         st.markdown("### 📊 Species Richness Analysis by Data Source")
-        image_path = get_generated_image_path('species_richness_by_source')
-        st.image(image_path, caption="Species Richness by Source - Comprehensive View from EDA Analysis", use_container_width=True)
+        st.image(load_generated_image('species_richness_by_source'), caption="Species Richness by Source - Comprehensive View from EDA Analysis", use_container_width=True)
         
         st.markdown("""
         **Key Findings from Richness Analysis:**
@@ -299,19 +307,22 @@ def show_species_richness_analysis(df):
     # Detailed breakdown
     st.markdown("### 📋 Source Contribution Details")
     
-    richness_data = df.groupby('Data.Source').agg({
-        'Species.Name': 'nunique',
-        'Records': 'sum',
-        'Grid': 'nunique'
-    }).reset_index()
-    richness_data.columns = ['Data Source', 'Unique Species', 'Total Records', 'Grids Covered']
+    # Cached per filtered frame; sort_index restores the per-source order
+    richness_data = aggregate_by_source(df).sort_index()[
+        ['Data.Source', 'Num_Species', 'Total_Records', 'Num_Grids']
+    ].rename(columns={
+        'Data.Source': 'Data Source',
+        'Num_Species': 'Unique Species',
+        'Total_Records': 'Total Records',
+        'Num_Grids': 'Grids Covered'
+    })
     
     st.dataframe(richness_data, use_container_width=True)
     
     # Stacked bar for species composition
     st.markdown("### Species Composition by Source")
     st.plotly_chart(
-        plot_stacked_bar_by_source(df, top_n=12),
+        plot_stacked_bar_by_source(build_stacked_pivot(df, top_n=12)),
         use_container_width=True
     )
     
@@ -372,11 +383,9 @@ def show_spatial_analysis(df):
             st.markdown("#### 🌡️ Multi-Panel Heat Maps by Species (KDE Density)")
             
             if check_generated_image('panel_mapps_heat'):
-                image_path = get_generated_image_path('panel_mapps_heat')
-                st.image(image_path, caption="Kernel Density Estimation (KDE) Heat Maps by Genus - UTM Grid Overlay", use_container_width=True)
+                st.image(load_generated_image('panel_mapps_heat'), caption="Kernel Density Estimation (KDE) Heat Maps by Genus - UTM Grid Overlay", use_container_width=True)
             elif check_generated_image('panel_mapas_calor'):
-                image_path = get_generated_image_path('panel_mapas_calor')
-                st.image(image_path, caption="Panel de Mapas de Calor por Especie", use_container_width=True)
+                st.image(load_generated_image('panel_mapas_calor'), caption="Panel de Mapas de Calor por Especie", use_container_width=True)
             
             st.markdown("""
             **Interpretation of Multi-Species Heat Maps:**
@@ -397,8 +406,7 @@ def show_spatial_analysis(df):
         # Records by species and grid faceted view
         if check_generated_image('records_by_species_grid'):
             st.markdown("#### 📊 Records by Species and UTM Grid (Top 12 Grids)")
-            image_path = get_generated_image_path('records_by_species_grid')
-            st.image(image_path, caption="Faceted Bar Plot: Species × Grid × Data Source", use_container_width=True)
+            st.image(load_generated_image('records_by_species_grid'), caption="Faceted Bar Plot: Species × Grid × Data Source", use_container_width=True)
             
             st.markdown("""
             **Grid-Level Species Composition:**
@@ -421,20 +429,19 @@ def show_spatial_analysis(df):
     # Interactive species × Grid heatmap
     st.markdown("### 🔄 Interactive Species Distribution Across UTM Grids")
     st.plotly_chart(
-        plot_species_grid_heatmap(df, top_n=15),
+        plot_species_grid_heatmap(build_species_grid_pivot(df, top_n=15)),
         use_container_width=True
     )
     
     # Grid ranking
     st.markdown("### 📊 Grid Activity Ranking")
     
-    grid_summary = df.groupby('Grid').agg({
-        'Records': 'sum',
-        'Species.Name': 'nunique',
-        'Data.Source': 'nunique'
-    }).reset_index()
-    grid_summary.columns = ['Grid', 'Total Records', 'Species Count', 'Sources']
-    grid_summary = grid_summary.sort_values('Total Records', ascending=False)
+    # Cached per filtered frame and already sorted by total records
+    grid_summary = aggregate_by_grid(df).rename(columns={
+        'Total_Records': 'Total Records',
+        'Num_Species': 'Species Count',
+        'Num_Sources': 'Sources'
+    })
     
     col1, col2 = st.columns([2, 1])
     
@@ -443,11 +450,14 @@ def show_spatial_analysis(df):
     
     with col2:
         st.markdown("#### 🏆 Top 3 Hotspots")
-        for idx, row in grid_summary.head(3).iterrows():
+        top_grids = grid_summary.iloc[:3]
+        for grid, records, species in zip(
+            top_grids['Grid'], top_grids['Total Records'], top_grids['Species Count']
+        ):
             st.metric(
-                f"Grid {row['Grid']}",
-                f"{int(row['Total Records'])} records",
-                f"{int(row['Species Count'])} species"
+                f"Grid {grid}",
+                f"{int(records)} records",
+                f"{int(species)} species"
             )
     
     # Insights
@@ -510,24 +520,23 @@ def show_temporal_analysis(df, data):
     """)
     if 'order' in gbif_df.columns:
         st.plotly_chart(
-            plot_temporal_trends(gbif_df, 'year', 'order'),
+            plot_temporal_trends(build_temporal_counts(gbif_df, 'year', 'order'), 'year', 'order'),
             use_container_width=True
         )
     
     # Year-by-year summary
     st.markdown("### 📅 Records by Year - Detailed Breakdown")
     
-    yearly_summary = gbif_df.groupby('year').size().reset_index(name='Records')
-    yearly_summary['Cumulative'] = yearly_summary['Records'].cumsum()
+    yearly_summary, recent_years = yearly_record_counts(gbif_df['year'].to_numpy())
     
     col1, col2 = st.columns([2, 1])
     
     with col1:
-        st.line_chart(yearly_summary.set_index('year')[['Records']])
+        st.plotly_chart(plot_yearly_records(yearly_summary, ['Records']), use_container_width=True)
     
     with col2:
         st.markdown("#### Recent Years (Last 5)")
-        st.dataframe(yearly_summary.tail(5), use_container_width=True)
+        st.dataframe(recent_years, use_container_width=True, hide_index=True)
     
     # Project context and conservation implications
     st.markdown(create_highlight_box("""
@@ -571,8 +580,7 @@ def show_multidimensional_analysis(df):
     # Check if generated image exists
     if check_generated_image('violin_log_records_platform'):
         st.markdown("### 📊 Generated Multi-dimensional Analysis (from EDA Notebook)")
-        image_path = get_generated_image_path('violin_log_records_platform')
-        st.image(image_path, caption="Violin Plot of Log-transformed Records by Platform", use_container_width=True)
+        st.image(load_generated_image('violin_log_records_platform'), caption="Violin Plot of Log-transformed Records by Platform", use_container_width=True)
         
         st.markdown("""
         **Key Multi-dimensional Patterns:**
@@ -587,7 +595,7 @@ def show_multidimensional_analysis(df):
     # Interactive sunburst chart
     st.markdown("### 🔄 Interactive Hierarchical View: Grid → Species → Source")
     st.plotly_chart(
-        plot_hierarchical_sunburst(df),
+        plot_hierarchical_sunburst(build_sunburst_agg(df)),
         use_container_width=True
     )
     
@@ -8,95 +8,118 @@ import streamlit as st
 from styles import create_section_header, create_highlight_box
 
 
-def show_ml_page():
-    """Render the Machine Learning (Coming Soon) page."""
+# ============================================================================
+# STATIC CONTENT
+# ============================================================================
+
+_PAGE_HEADER_HTML = create_section_header(
+    "🤖 Machine Learning & Predictive Analytics",
+    "Advanced modeling and AI-powered insights (In Development)"
+)
+
+_PREDICTIVE_MODELS_HTML = create_highlight_box("""
+    <h3>📊 Predictive Models</h3>
     
-    # Page header
-    st.markdown(create_section_header(
-        "🤖 Machine Learning & Predictive Analytics",
-        "Advanced modeling and AI-powered insights (In Development)"
-    ), unsafe_allow_html=True)
+    <h4>Species Distribution Models (SDMs)</h4>
+    <ul>
+        <li>Predict species occurrence probability</li>
+        <li>Identify suitable habitats</li>
+        <li>Project climate change impacts</li>
+        <li>Guide conservation prioritization</li>
+    </ul>
     
-    # Coming soon message
-    st.info("""
-    🚧 **This section is currently under development.**
+    <h4>Occupancy Modeling</h4>
+    <ul>
+        <li>Estimate detection probability</li>
+        <li>Account for imperfect detection</li>
+        <li>Model site occupancy dynamics</li>
+        <li>Assess sampling adequacy</li>
+    </ul>
     
-    Future machine learning capabilities will enhance the dashboard with 
-    predictive models, automated pattern recognition, and AI-powered insights.
-    """)
+    <h4>Temporal Forecasting</h4>
+    <ul>
+        <li>Predict seasonal abundance patterns</li>
+        <li>Forecast population trends</li>
+        <li>Detect anomalies and early warnings</li>
+        <li>Optimize sampling schedules</li>
+    </ul>
+""", 'info')
+
+_AI_TOOLS_HTML = create_highlight_box("""
+    <h3>🤖 AI-Powered Tools</h3>
     
-    # Planned features
-    st.markdown("## 🔮 Planned Features")
+    <h4>Automated Species Identification</h4>
+    <ul>
+        <li>Deep learning image classification</li>
+        <li>Real-time camera trap processing</li>
+        <li>Confidence scoring and validation</li>
+        <li>Reduce manual identification effort</li>
+    </ul>
     
-    col1, col2 = st.columns(2)
+    <h4>Anomaly Detection</h4>
+    <ul>
+        <li>Identify unusual observation patterns</li>
+        <li>Flag potential data quality issues</li>
+        <li>Detect rare or unexpected species</li>
+        <li>Monitor ecosystem health indicators</li>
+    </ul>
     
-    with col1:
-        st.markdown(create_highlight_box("""
-        <h3>📊 Predictive Models</h3>
-        
-        <h4>Species Distribution Models (SDMs)</h4>
-        <ul>
-            <li>Predict species occurrence probability</li>
-            <li>Identify suitable habitats</li>
-            <li>Project climate change impacts</li>
-            <li>Guide conservation prioritization</li>
-        </ul>
-        
-        <h4>Occupancy Modeling</h4>
-        <ul>
-            <li>Estimate detection probability</li>
-            <li>Account for imperfect detection</li>
-            <li>Model site occupancy dynamics</li>
-            <li>Assess sampling adequacy</li>
-        </ul>
-        
-        <h4>Temporal Forecasting</h4>
-        <ul>
-            <li>Predict seasonal abundance patterns</li>
-            <li>Forecast population trends</li>
-            <li>Detect anomalies and early warnings</li>
-            <li>Optimize sampling schedules</li>
-        </ul>
-        """, 'info'), unsafe_allow_html=True)
+    <h4>Clustering & Pattern Mining</h4>
+    <ul>
+        <li>Discover hidden data structures</li>
+        <li>Group similar species/grids</li>
+        <li>Identify community assemblages</li>
+        <li>Reveal ecological relationships</li>
+    </ul>
+""", 'success')
+
+_ROADMAP_HTML = create_highlight_box("""
+    <h2>🗓️ Implementation Roadmap</h2>
     
-    with col2:
-        st.markdown(create_highlight_box("""
-        <h3>🤖 AI-Powered Tools</h3>
-        
-        <h4>Automated Species Identification</h4>
-        <ul>
-            <li>Deep learning image classification</li>
-            <li>Real-time camera trap processing</li>
-            <li>Confidence scoring and validation</li>
-            <li>Reduce manual identification effort</li>
-        </ul>
-        
-        <h4>Anomaly Detection</h4>
-        <ul>
-            <li>Identify unusual observation patterns</li>
-            <li>Flag potential data quality issues</li>
-            <li>Detect rare or unexpected species</li>
-            <li>Monitor ecosystem health indicators</li>
-        </ul>
-        
-        <h4>Clustering & Pattern Mining</h4>
-        <ul>
-            <li>Discover hidden data structures</li>
-            <li>Group similar species/grids</li>
-            <li>Identify community assemblages</li>
-            <li>Reveal ecological relationships</li>
-        </ul>
-        """, 'success'), unsafe_allow_html=True)
+    <h3>Phase 1: Data Preparation (Months 1-2)</h3>
+    <ul>
+        <li>Acquire environmental raster layers</li>
+        <li>Clean and validate training data</li>
+        <li>Create model-ready datasets</li>
+        <li>Document data provenance</li>
+    </ul>
     
-    st.markdown("---")
+    <h3>Phase 2: Baseline Models (Months 3-4)</h3>
+    <ul>
+        <li>Develop initial SDMs for top 5 species</li>
+        <li>Implement clustering for spatial patterns</li>
+        <li>Create simple anomaly detection</li>
+        <li>Validate with held-out data</li>
+    </ul>
     
-    # Technical approach
-    st.markdown("## 🛠️ Technical Approach")
+    <h3>Phase 3: Advanced Analytics (Months 5-6)</h3>
+    <ul>
+        <li>Integrate deep learning for images</li>
+        <li>Build temporal forecasting models</li>
+        <li>Develop ensemble predictions</li>
+        <li>Add uncertainty quantification</li>
+    </ul>
     
-    tab1, tab2, tab3 = st.tabs(["Algorithms", "Data Requirements", "Validation"])
+    <h3>Phase 4: Dashboard Integration (Months 7-8)</h3>
+    <ul>
+        <li>Embed interactive prediction maps</li>
+        <li>Add model performance dashboards</li>
+        <li>Create "what-if" scenario tools</li>
+        <li>Enable automated report generation</li>
+    </ul>
     
-    with tab1:
-        st.markdown("""
+    <h3>Phase 5: Continuous Improvement (Ongoing)</h3>
+    <ul>
+        <li>Retrain models with new data</li>
+        <li>Monitor prediction accuracy</li>
+        <li>Expand to additional species/regions</li>
+        <li>Incorporate user feedback</li>
+    </ul>
+""", 'highlight')
+
+# Markdown for each section selector option
+_TECHNICAL_APPROACH_SECTIONS = {
+    "Algorithms": """
         ### Machine Learning Algorithms
         
         **Supervised Learning:**
@@ -119,10 +142,8 @@ def show_ml_page():
         - **MaxEnt**: Maximum entropy species distribution
         - **Spatial Autoregressive Models**: Account for spatial autocorrelation
         - **Gaussian Processes**: Flexible spatial prediction
-        """)
-    
-    with tab2:
-        st.markdown("""
+    """,
+    "Data Requirements": """
         ### Data Requirements for ML
         
         **Environmental Predictors:**
@@ -145,10 +166,8 @@ def show_ml_page():
         - Handling missing values
         - Balancing classes (for rare species)
         - Train/validation/test split strategies
-        """)
-    
-    with tab3:
-        st.markdown("""
+    """,
+    "Validation": """
         ### Model Validation & Evaluation
         
         **Performance Metrics:**
@@ -171,7 +190,49 @@ def show_ml_page():
         - Compare predictions with held-out camera trap data
         - Expert review of flagged anomalies
         - Ground-truthing of predicted hotspots
-        """)
+    """
+}
+
+
+def show_ml_page():
+    """Render the Machine Learning (Coming Soon) page."""
+    
+    # Page header
+    st.markdown(_PAGE_HEADER_HTML, unsafe_allow_html=True)
+    
+    # Coming soon message
+    st.info("""
+    🚧 **This section is currently under development.**
+    
+    Future machine learning capabilities will enhance the dashboard with 
+    predictive models, automated pattern recognition, and AI-powered insights.
+    """)
+    
+    # Planned features
+    st.markdown("## 🔮 Planned Features")
+    
+    col1, col2 = st.columns(2)
+    
+    with col1:
+        st.markdown(_PREDICTIVE_MODELS_HTML, unsafe_allow_html=True)
+    
+    with col2:
+        st.markdown(_AI_TOOLS_HTML, unsafe_allow_html=True)
+    
+    st.markdown("---")
+    
+    # Technical approach
+    st.markdown("## 🛠️ Technical Approach")
+    
+    # Only the selected section is rendered, unlike st.tabs which builds them all
+    section = st.radio(
+        "Technical approach:",
+        options=list(_TECHNICAL_APPROACH_SECTIONS),
+        horizontal=True,
+        label_visibility="collapsed",
+        key='ml_approach_tab'
+    )
+    st.markdown(_TECHNICAL_APPROACH_SECTIONS[section])
     
     st.markdown("---")
     
@@ -228,49 +289,7 @@ def show_ml_page():
     st.markdown("---")
     
     # Integration roadmap
-    st.markdown(create_highlight_box("""
-    <h2>🗓️ Implementation Roadmap</h2>
-    
-    <h3>Phase 1: Data Preparation (Months 1-2)</h3>
-    <ul>
-        <li>Acquire environmental raster layers</li>
-        <li>Clean and validate training data</li>
-        <li>Create model-ready datasets</li>
-        <li>Document data provenance</li>
-    </ul>
-    
-    <h3>Phase 2: Baseline Models (Months 3-4)</h3>
-    <ul>
-        <li>Develop initial SDMs for top 5 species</li>
-        <li>Implement clustering for spatial patterns</li>
-        <li>Create simple anomaly detection</li>
-        <li>Validate with held-out data</li>
-    </ul>
-    
-    <h3>Phase 3: Advanced Analytics (Months 5-6)</h3>
-    <ul>
-        <li>Integrate deep learning for images</li>
-        <li>Build temporal forecasting models</li>
-        <li>Develop ensemble predictions</li>
-        <li>Add uncertainty quantification</li>
-    </ul>
-    
-    <h3>Phase 4: Dashboard Integration (Months 7-8)</h3>
-    <ul>
-        <li>Embed interactive prediction maps</li>
-        <li>Add model performance dashboards</li>
-        <li>Create "what-if" scenario tools</li>
-        <li>Enable automated report generation</li>
-    </ul>
-    
-    <h3>Phase 5: Continuous Improvement (Ongoing)</h3>
-    <ul>
-        <li>Retrain models with new data</li>
-        <li>Monitor prediction accuracy</li>
-        <li>Expand to additional species/regions</li>
-        <li>Incorporate user feedback</li>
-    </ul>
-    """, 'highlight'), unsafe_allow_html=True)
+    st.markdown(_ROADMAP_HTML, unsafe_allow_html=True)
     
     st.markdown("---")
     
@@ -8,75 +8,77 @@ import streamlit as st
 from styles import create_section_header, create_highlight_box
 
 
-def show_origin_page():
-    """Render the Origin & Context page."""
-    
-    # Page header
-    st.markdown(create_section_header(
-        "📚 Project Origin & Context",
-        "Understanding the Citizen Science Wildlife Monitoring Initiative"
-    ), unsafe_allow_html=True)
-    
-    # Introduction
-    st.markdown("""
-    ## Overview
-    
-    This dashboard presents comprehensive analyses of wildlife monitoring data from the 
-    **Córdoba province citizen science project**. The initiative combines educational 
-    outreach with scientific research to improve our understanding of wild mammal 
-    distribution in Spain.
-    """)
-    
-    # Project background
-    col1, col2 = st.columns([1, 1])
-    
-    with col1:
-        st.markdown("""
-        <div style='background-color: #e3f2fd; padding: 20px; border-radius: 10px; border-left: 5px solid #1976d2;'>
-            <h3 style='color: #1976d2; margin-top: 0;'>🎯 Main Objective</h3>
-            <p>
-            To assess whether school participation can generate a significant volume of 
-            reliable data on the distribution of wild mammals, comparable to historical 
-            records available on platforms such as GBIF.
-            </p>
-            <p>
-            The results demonstrate that over a four-month period, camera trapping produced 
-            a large number of records, documenting previously unconfirmed species and 
-            suggesting this approach is a viable strategy for updating distribution atlases 
-            and promoting scientific literacy in education.
-            </p>
-        </div>
-        """, unsafe_allow_html=True)
-    
-    with col2:
-        st.markdown("""
-        <div style='background-color: #e8f5e9; padding: 20px; border-radius: 10px; border-left: 5px solid #388e3c;'>
-            <h3 style='color: #388e3c; margin-top: 0;'>📊 Key Statistics</h3>
-            <ul>
-                <li><strong>11 educational centers</strong> participated</li>
-                <li><strong>800 students</strong> aged 4-12 years</li>
-                <li><strong>11 UTM grids</strong> (10×10 km) surveyed</li>
-                <li><strong>1,605 sequence records</strong> generated</li>
-                <li><strong>589 daily records</strong> over 4 months</li>
-                <li><strong>15 wild mammal species</strong> documented</li>
-            </ul>
-        </div>
-        """, unsafe_allow_html=True)
-    
-    st.markdown("---")
-    
-    # Project design
-    st.markdown("""
-    ## 🗺️ Project Design & Geographical Context
+# ============================================================================
+# STATIC CONTENT
+# ============================================================================
+
+_PAGE_HEADER_HTML = create_section_header(
+    "📚 Project Origin & Context",
+    "Understanding the Citizen Science Wildlife Monitoring Initiative"
+)
+
+_MAIN_OBJECTIVE_HTML = """
+    <div style='background-color: #e3f2fd; padding: 20px; border-radius: 10px; border-left: 5px solid #1976d2;'>
+        <h3 style='color: #1976d2; margin-top: 0;'>🎯 Main Objective</h3>
+        <p>
+        To assess whether school participation can generate a significant volume of 
+        reliable data on the distribution of wild mammals, comparable to historical 
+        records available on platforms such as GBIF.
+        </p>
+        <p>
+        The results demonstrate that over a four-month period, camera trapping produced 
+        a large number of records, documenting previously unconfirmed species and 
+        suggesting this approach is a viable strategy for updating distribution atlases 
+        and promoting scientific literacy in education.
+        </p>
+    </div>
+"""
+
+_KEY_STATISTICS_HTML = """
+    <div style='background-color: #e8f5e9; padding: 20px; border-radius: 10px; border-left: 5px solid #388e3c;'>
+        <h3 style='color: #388e3c; margin-top: 0;'>📊 Key Statistics</h3>
+        <ul>
+            <li><strong>11 educational centers</strong> participated</li>
+            <li><strong>800 students</strong> aged 4-12 years</li>
+            <li><strong>11 UTM grids</strong> (10×10 km) surveyed</li>
+            <li><strong>1,605 sequence records</strong> generated</li>
+            <li><strong>589 daily records</strong> over 4 months</li>
+            <li><strong>15 wild mammal species</strong> documented</li>
+        </ul>
+    </div>
+"""
+
+_IMPACT_HTML = create_highlight_box("""
+    <h2>💡 Impact & Significance</h2>
     
-    The study was conceived as an educational and citizen science experience carried out 
-    between **January and April 2024** in the province of Córdoba, Spain.
-    """)
+    <h3>Educational Impact</h3>
+    <ul>
+        <li>Enhanced scientific literacy among 800 students</li>
+        <li>Hands-on experience with real research methods</li>
+        <li>Increased environmental awareness and conservation values</li>
+        <li>Development of critical thinking and data analysis skills</li>
+    </ul>
     
-    tab1, tab2, tab3 = st.tabs(["🎓 Participants", "📍 Study Area", "🎯 Activities"])
+    <h3>Scientific Contribution</h3>
+    <ul>
+        <li>Generated data volume comparable to 15 years of GBIF records</li>
+        <li>Documented species previously unconfirmed in specific grids</li>
+        <li>Provided reliable, verifiable wildlife distribution data</li>
+        <li>Demonstrated viability of school-based citizen science</li>
+    </ul>
     
-    with tab1:
-        st.markdown("""
+    <h3>Conservation Value</h3>
+    <ul>
+        <li>Updated distribution information for conservation planning</li>
+        <li>Identified biodiversity hotspots and gaps</li>
+        <li>Created baseline data for long-term monitoring</li>
+        <li>Engaged local communities in wildlife conservation</li>
+    </ul>
+""", 'highlight')
+
+# Markdown for each section selector option
+_PROJECT_DESIGN_SECTIONS = {
+    "🎓 Participants": """
         ### Participants and Scope
         
         A total of **11 educational centers** and **800 schoolchildren** aged between 
@@ -92,10 +94,8 @@ def show_origin_page():
         
         The aim was to promote **scientific, participatory, and social dimensions**, 
         stimulating interest in science and conservation among young students.
-        """)
-    
-    with tab2:
-        st.markdown("""
+    """,
+    "📍 Study Area": """
         ### Study Area
         
         Sampling covered **11 UTM grids of 10×10 km** near educational centers in Córdoba, 
@@ -108,10 +108,8 @@ def show_origin_page():
         
         This diversity of habitats allowed for comprehensive species detection across 
         different ecological contexts.
-        """)
-    
-    with tab3:
-        st.markdown("""
+    """,
+    "🎯 Activities": """
         ### Key Activities
         
         Students engaged in multiple aspects of the scientific process:
@@ -124,7 +122,54 @@ def show_origin_page():
         6. **Result Communication**: Presented findings to peers and community
         
         This hands-on approach fostered **scientific literacy** and **environmental awareness**.
-        """)
+    """
+}
+
+
+def show_origin_page():
+    """Render the Origin & Context page."""
+    
+    # Page header
+    st.markdown(_PAGE_HEADER_HTML, unsafe_allow_html=True)
+    
+    # Introduction
+    st.markdown("""
+    ## Overview
+    
+    This dashboard presents comprehensive analyses of wildlife monitoring data from the 
+    **Córdoba province citizen science project**. The initiative combines educational 
+    outreach with scientific research to improve our understanding of wild mammal 
+    distribution in Spain.
+    """)
+    
+    # Project background
+    col1, col2 = st.columns([1, 1])
+    
+    with col1:
+        st.markdown(_MAIN_OBJECTIVE_HTML, unsafe_allow_html=True)
+    
+    with col2:
+        st.markdown(_KEY_STATISTICS_HTML, unsafe_allow_html=True)
+    
+    st.markdown("---")
+    
+    # Project design
+    st.markdown("""
+    ## 🗺️ Project Design & Geographical Context
+    
+    The study was conceived as an educational and citizen science experience carried out 
+    between **January and April 2024** in the province of Córdoba, Spain.
+    """)
+    
+    # Only the selected section is rendered, unlike st.tabs which builds them all
+    section = st.radio(
+        "Project design:",
+        options=list(_PROJECT_DESIGN_SECTIONS),
+        horizontal=True,
+        label_visibility="collapsed",
+        key='origin_design_tab'
+    )
+    st.markdown(_PROJECT_DESIGN_SECTIONS[section])
     
     st.markdown("---")
     
@@ -173,33 +218,7 @@ def show_origin_page():
     st.markdown("---")
     
     # Impact and significance
-    st.markdown(create_highlight_box("""
-    <h2>💡 Impact & Significance</h2>
-    
-    <h3>Educational Impact</h3>
-    <ul>
-        <li>Enhanced scientific literacy among 800 students</li>
-        <li>Hands-on experience with real research methods</li>
-        <li>Increased environmental awareness and conservation values</li>
-        <li>Development of critical thinking and data analysis skills</li>
-    </ul>
-    
-    <h3>Scientific Contribution</h3>
-    <ul>
-        <li>Generated data volume comparable to 15 years of GBIF records</li>
-        <li>Documented species previously unconfirmed in specific grids</li>
-        <li>Provided reliable, verifiable wildlife distribution data</li>
-        <li>Demonstrated viability of school-based citizen science</li>
-    </ul>
-    
-    <h3>Conservation Value</h3>
-    <ul>
-        <li>Updated distribution information for conservation planning</li>
-        <li>Identified biodiversity hotspots and gaps</li>
-        <li>Created baseline data for long-term monitoring</li>
-        <li>Engaged local communities in wildlife conservation</li>
-    </ul>
-    """, 'highlight'), unsafe_allow_html=True)
+    st.markdown(_IMPACT_HTML, unsafe_allow_html=True)
     
     st.markdown("---")
     
@@ -7,18 +7,88 @@ Provides consistent styling and reusable plotting components.
 
 import plotly.express as px
 import plotly.graph_objects as go
+import plotly.io as pio
 from plotly.subplots import make_subplots
 import pandas as pd
+import geopandas as gpd
 import numpy as np
+import streamlit as st
 from typing import Optional, List, Dict
 
 from config import DATA_SOURCE_COLORS, CHART_COLORS, CHART_CONFIG
+from data_loader import frame_fingerprint
+
+
+# ============================================================================
+# FIGURE CACHING
+# ============================================================================
+# Built figures are shared across reruns and sessions; st.plotly_chart only
+# serializes them, so callers must not modify the returned objects.
+# Charts of row subsets of the loaded datasets are keyed by frame_fingerprint;
+# charts of aggregated tables (fresh RangeIndex) need full content hashing.
+
+_cache_subset_figure = st.cache_resource(
+    ttl=3600, max_entries=32, show_spinner=False,
+    hash_funcs={pd.DataFrame: frame_fingerprint, gpd.GeoDataFrame: frame_fingerprint}
+)
+_cache_aggregate_figure = st.cache_resource(ttl=3600, max_entries=32, show_spinner=False)
+
+
+# ============================================================================
+# SHARED LAYOUT
+# ============================================================================
+# Built once at import and spread into each figure's update_layout call.
+# plotly_white is made the default template because a new Figure applies the
+# default without validating it, while naming a template in update_layout
+# validates and deep-copies it on every build. Plotly Express still takes the
+# template Streamlit registers (its colour sequence is what the streamlit
+# chart theme recolours) and then switches the layout to plotly_white, as
+# before. Looked up by name so a module reload picks the same template.
+
+_PX_TEMPLATE = 'streamlit' if 'streamlit' in pio.templates else 'plotly'
+pio.templates.default = 'plotly_white'
+
+_DEFAULT_HEIGHT = CHART_CONFIG['default_height']
+_MAX_HEATMAP_LABELS = CHART_CONFIG['max_heatmap_labels']
+_BASE_FONT = dict(size=CHART_CONFIG['font_size'])
+_BASE_LAYOUT = dict(font=_BASE_FONT)
+_PX_LAYOUT = dict(_BASE_LAYOUT, template='plotly_white')
 
 
 # ============================================================================
 # DISTRIBUTION VISUALIZATIONS
 # ============================================================================
 
+def _histogram_bar(values: pd.Series, bins: int, name: str, color: str) -> go.Bar:
+    """
+    Bin values with NumPy and return them as a bar trace.
+    
+    Only the bin counts are sent to the browser instead of every raw value.
+    
+    Args:
+        values: Numeric values to bin
+        bins: Number of equal-width bins
+        name: Trace name
+        color: Bar color
+        
+    Returns:
+        go.Bar trace spanning the bin edges
+    """
+    counts, edges = np.histogram(values.dropna().to_numpy(), bins=bins)
+    
+    return go.Bar(
+        x=(edges[:-1] + edges[1:]) / 2,
+        y=counts,
+        width=np.diff(edges),
+        customdata=np.column_stack([edges[:-1], edges[1:]]),
+        hovertemplate='%{customdata[0]:.4g} - %{customdata[1]:.4g}<br>Count: %{y}<extra></extra>',
+        name=name,
+        marker_color=color,
+        opacity=0.7
+    )
+
+
+@_cache_subset_figure
 def plot_distribution_histogram(
     df: pd.DataFrame,
     column: str,
@@ -41,28 +111,23 @@ def plot_distribution_histogram(
     """
     fig = go.Figure()
     
-    # Add histogram
-    fig.add_trace(go.Histogram(
-        x=df[column],
-        nbinsx=bins,
-        name='Frequency',
-        marker_color=color,
-        opacity=0.7
-    ))
+    # Add histogram (binned server-side)
+    fig.add_trace(_histogram_bar(df[column], bins, 'Frequency', color))
     
     fig.update_layout(
+        **_BASE_LAYOUT,
         title=title,
         xaxis_title=column.replace('_', ' ').title(),
         yaxis_title='Frequency',
-        template='plotly_white',
-        height=CHART_CONFIG['default_height'],
-        showlegend=False,
-        font=dict(size=CHART_CONFIG['font_size'])
+        height=_DEFAULT_HEIGHT,
+        bargap=0,
+        showlegend=False
     )
     
     return fig
 
 
+@_cache_subset_figure
 def plot_dual_histograms(
     df_sequences: pd.DataFrame,
     df_daily: pd.DataFrame,
@@ -86,34 +151,22 @@ def plot_dual_histograms(
     
     # Sequences histogram
     fig.add_trace(
-        go.Histogram(
-            x=df_sequences['Records'],
-            nbinsx=bins,
-            name='Sequences',
-            marker_color='#4169E1',
-            opacity=0.7
-        ),
+        _histogram_bar(df_sequences['Records'], bins, 'Sequences', '#4169E1'),
         row=1, col=1
     )
     
     # Daily histogram
     fig.add_trace(
-        go.Histogram(
-            x=df_daily['Records'],
-            nbinsx=bins,
-            name='Daily',
-            marker_color='#FFD700',
-            opacity=0.7
-        ),
+        _histogram_bar(df_daily['Records'], bins, 'Daily', '#FFD700'),
         row=1, col=2
     )
     
     fig.update_layout(
+        **_BASE_LAYOUT,
         title_text='Record Count Distributions by Source Type',
-        template='plotly_white',
         height=500,
-        showlegend=False,
-        font=dict(size=12)
+        bargap=0,
+        showlegend=False
     )
     
     fig.update_xaxes(title_text='Number of Records', row=1, col=1)
@@ -127,6 +180,96 @@ def plot_dual_histograms(
 # CORRELATION VISUALIZATIONS
 # ============================================================================
 
+def _labelled_scatter_traces(
+    df: pd.DataFrame,
+    x_col: str,
+    y_col: str,
+    label_col: str,
+    color: str,
+    name: str,
+    max_labels: int = CHART_CONFIG['max_point_labels'],
+    textsize: int = 9
+) -> List[go.Scattergl]:
+    """
+    Build a WebGL marker trace for every point plus a text trace that labels
+    only the points with the largest combined magnitude.
+    
+    Args:
+        df: Input DataFrame
+        x_col: X-axis column name
+        y_col: Y-axis column name
+        label_col: Column with point labels
+        color: Marker colour
+        name: Trace name
+        max_labels: Maximum number of labelled points
+        textsize: Label font size
+        
+    Returns:
+        List with the marker trace and the label trace
+    """
+    # float32 halves the typed-array payload Plotly ships to the browser
+    x = df[x_col].to_numpy(dtype=np.float32)
+    y = df[y_col].to_numpy(dtype=np.float32)
+    
+    score = np.abs(x) + np.abs(y)
+    top = np.argsort(np.nan_to_num(score, nan=-np.inf))[::-1][:max_labels]
+    
+    return [
+        go.Scattergl(
+            x=x,
+            y=y,
+            mode='markers',
+            marker=dict(size=10, color=color, opacity=0.7),
+            text=df[label_col].to_numpy(),
+            hovertemplate='%{text}<br>%{x}, %{y}<extra></extra>',
+            name=name
+        ),
+        go.Scattergl(
+            x=x[top],
+            y=y[top],
+            mode='text',
+            text=df[label_col].to_numpy()[top],
+            textposition='top center',
+            textfont=dict(size=textsize),
+            hoverinfo='skip',
+            showlegend=False
+        )
+    ]
+
+
+def _trendline_trace(x: pd.Series, y: pd.Series) -> Optional[go.Scatter]:
+    """
+    Fit a least-squares line through the points.
+    
+    Args:
+        x: X values
+        y: Y values
+        
+    Returns:
+        Line trace spanning the x range, or None if no line can be fitted
+    """
+    x = x.to_numpy(dtype=float)
+    y = y.to_numpy(dtype=float)
+    valid = np.isfinite(x) & np.isfinite(y)
+    x, y = x[valid], y[valid]
+    
+    if len(x) < 2 or np.ptp(x) == 0:
+        return None
+    
+    slope, intercept = np.polyfit(x, y, 1)
+    x_line = np.array([x.min(), x.max()])
+    
+    return go.Scatter(
+        x=x_line,
+        y=slope * x_line + intercept,
+        mode='lines',
+        line=dict(color='#636EFA', width=2),
+        name='OLS trendline',
+        hoverinfo='skip'
+    )
+
+
+@_cache_aggregate_figure
 def plot_correlation_scatter(
     df: pd.DataFrame,
     x_col: str,
@@ -149,33 +292,25 @@ def plot_correlation_scatter(
     Returns:
         plotly Figure object
     """
-    fig = px.scatter(
-        df,
-        x=x_col,
-        y=y_col,
-        text=species_col,
-        trendline='ols',
-        title=f"{title}<br><sub>Pearson r = {correlation:.3f}</sub>"
-    )
+    fig = go.Figure(data=_labelled_scatter_traces(df, x_col, y_col, species_col, '#4169E1', 'Species'))
     
-    # Update traces
-    fig.update_traces(
-        marker=dict(size=10, opacity=0.7, color='#4169E1'),
-        textposition='top center',
-        textfont=dict(size=9)
-    )
+    trendline = _trendline_trace(df[x_col], df[y_col])
+    if trendline is not None:
+        fig.add_trace(trendline)
     
     fig.update_layout(
-        template='plotly_white',
-        height=CHART_CONFIG['default_height'],
+        **_BASE_LAYOUT,
+        title=f"{title}<br><sub>Pearson r = {correlation:.3f}</sub>",
+        height=_DEFAULT_HEIGHT,
         xaxis_title=x_col.replace('_', ' ').title(),
         yaxis_title=y_col.replace('_', ' ').title(),
-        font=dict(size=CHART_CONFIG['font_size'])
+        showlegend=False
     )
     
     return fig
 
 
+@_cache_aggregate_figure
 def plot_correlation_comparison(
     df_all: pd.DataFrame,
     df_filtered: pd.DataFrame,
@@ -205,38 +340,20 @@ def plot_correlation_comparison(
     )
     
     # All species scatter
-    fig.add_trace(
-        go.Scatter(
-            x=df_all['Daily_Sum'],
-            y=df_all['Sequences_Sum'],
-            mode='markers+text',
-            text=df_all['Species.Name'],
-            textposition='top center',
-            textfont=dict(size=8),
-            marker=dict(size=10, color='#4169E1', opacity=0.6),
-            name='All Species'
-        ),
-        row=1, col=1
-    )
+    for trace in _labelled_scatter_traces(
+        df_all, 'Daily_Sum', 'Sequences_Sum', 'Species.Name', '#4169E1', 'All Species', textsize=8
+    ):
+        fig.add_trace(trace, row=1, col=1)
     
     # Filtered scatter
-    fig.add_trace(
-        go.Scatter(
-            x=df_filtered['Daily_Sum'],
-            y=df_filtered['Sequences_Sum'],
-            mode='markers+text',
-            text=df_filtered['Species.Name'],
-            textposition='top center',
-            textfont=dict(size=8),
-            marker=dict(size=10, color='#FF8C00', opacity=0.6),
-            name='Filtered'
-        ),
-        row=1, col=2
-    )
+    for trace in _labelled_scatter_traces(
+        df_filtered, 'Daily_Sum', 'Sequences_Sum', 'Species.Name', '#FF8C00', 'Filtered', textsize=8
+    ):
+        fig.add_trace(trace, row=1, col=2)
     
     fig.update_layout(
+        **_BASE_LAYOUT,
         title_text='Correlation Analysis: Daily vs Sequences Records',
-        template='plotly_white',
         height=500,
         showlegend=False
     )
@@ -253,6 +370,7 @@ def plot_correlation_comparison(
 # BAR CHARTS
 # ============================================================================
 
+@_cache_subset_figure
 def plot_species_richness_by_source(df: pd.DataFrame) -> go.Figure:
     """
     Create bar chart showing species richness per data source.
@@ -263,36 +381,37 @@ def plot_species_richness_by_source(df: pd.DataFrame) -> go.Figure:
     Returns:
         plotly Figure object
     """
-    # Calculate richness
-    richness = df.groupby('Data.Source')['Species.Name'].nunique().reset_index()
-    richness.columns = ['Data Source', 'Number of Species']
-    richness = richness.sort_values('Number of Species', ascending=False)
+    # One dedup pass over the (source, species) pairs, then count per source
+    pairs = df[['Data.Source', 'Species.Name']].dropna().drop_duplicates()
+    richness = pairs.groupby('Data.Source', observed=True).size().sort_values(ascending=False)
+    sources = richness.index.astype(object)
+    counts = richness.to_numpy()
     
     # Map colors
-    colors = [DATA_SOURCE_COLORS.get(src, '#808080') for src in richness['Data Source']]
+    colors = sources.map(DATA_SOURCE_COLORS).fillna('#808080').to_numpy()
     
     fig = go.Figure(data=[
         go.Bar(
-            x=richness['Data Source'],
-            y=richness['Number of Species'],
+            x=sources.to_numpy(),
+            y=counts,
             marker_color=colors,
-            text=richness['Number of Species'],
+            text=counts,
             textposition='outside'
         )
     ])
     
     fig.update_layout(
+        **_BASE_LAYOUT,
         title='Species Richness by Data Source',
         xaxis_title='Data Source',
         yaxis_title='Number of Unique Species',
-        template='plotly_white',
-        height=CHART_CONFIG['default_height'],
-        font=dict(size=CHART_CONFIG['font_size'])
+        height=_DEFAULT_HEIGHT
     )
     
     return fig
 
 
+@_cache_aggregate_figure
 def plot_records_by_species(
     df: pd.DataFrame,
     top_n: int = 15,
@@ -309,16 +428,16 @@ def plot_records_by_species(
     Returns:
         plotly Figure object
     """
-    # Check if we need to aggregate or if data is already aggregated
+    # nlargest already orders descending, so reversing gives the ascending
+    # order horizontal bars need without a second sort
     if 'Total_Records' in df.columns:
         # Data is already aggregated
-        species_counts = df.nlargest(top_n, 'Total_Records')
-        species_counts = species_counts.sort_values('Total_Records', ascending=True)
+        species_counts = df.nlargest(top_n, 'Total_Records').iloc[::-1]
         records_col = 'Total_Records'
     else:
         # Need to aggregate
-        species_counts = df.groupby('Species.Name')['Records'].sum().nlargest(top_n).reset_index()
-        species_counts = species_counts.sort_values('Records', ascending=True)
+        species_totals = df.groupby('Species.Name', observed=True, sort=False)['Records'].sum()
+        species_counts = species_totals.nlargest(top_n).iloc[::-1].reset_index()
         records_col = 'Records'
     
     if horizontal:
@@ -353,15 +472,15 @@ def plot_records_by_species(
         fig.update_xaxes(tickangle=45)
     
     fig.update_layout(
+        **_BASE_LAYOUT,
         title=f'Top {top_n} Species by Total Records',
-        template='plotly_white',
-        height=CHART_CONFIG['default_height'],
-        font=dict(size=CHART_CONFIG['font_size'])
+        height=_DEFAULT_HEIGHT
     )
     
     return fig
 
 
+@_cache_aggregate_figure
 def plot_records_by_grid(df: pd.DataFrame, top_n: int = 10) -> go.Figure:
     """
     Create bar chart of records by UTM grid (top N).
@@ -374,7 +493,7 @@ def plot_records_by_grid(df: pd.DataFrame, top_n: int = 10) -> go.Figure:
         plotly Figure object
     """
     # Get top grids (df already aggregated with Total_Records column)
-    grid_counts = df.nlargest(top_n, 'Total_Records').sort_values('Total_Records', ascending=True)
+    grid_counts = df.nlargest(top_n, 'Total_Records').iloc[::-1]
     
     fig = go.Figure(data=[
         go.Bar(
@@ -388,60 +507,45 @@ def plot_records_by_grid(df: pd.DataFrame, top_n: int = 10) -> go.Figure:
     ])
     
     fig.update_layout(
+        **_BASE_LAYOUT,
         title=f'Top {top_n} UTM Grids by Total Records',
         xaxis_title='Total Records',
         yaxis_title='UTM Grid',
-        template='plotly_white',
-        height=CHART_CONFIG['default_height'],
-        font=dict(size=CHART_CONFIG['font_size'])
+        height=_DEFAULT_HEIGHT
     )
     
     return fig
 
 
-def plot_stacked_bar_by_source(df: pd.DataFrame, top_n: int = 10) -> go.Figure:
+@_cache_aggregate_figure
+def plot_stacked_bar_by_source(pivot_df: pd.DataFrame) -> go.Figure:
     """
     Create stacked bar chart showing species composition by data source.
     
     Args:
-        df: Input DataFrame
-        top_n: Number of top species to display
+        pivot_df: Species × source totals from build_stacked_pivot
         
     Returns:
         plotly Figure object
     """
-    # Get top species
-    top_species = df.groupby('Species.Name')['Records'].sum().nlargest(top_n).index
-    df_filtered = df[df['Species.Name'].isin(top_species)]
-    
-    # Pivot for stacked bar
-    pivot_df = df_filtered.pivot_table(
-        values='Records',
-        index='Species.Name',
-        columns='Data.Source',
-        aggfunc='sum',
-        fill_value=0
-    )
+    species = pivot_df.index.to_numpy()
+    sources = pivot_df.columns.astype(object)
+    values = pivot_df.to_numpy()
+    colors = sources.map(DATA_SOURCE_COLORS).fillna('#808080').to_numpy()
     
-    fig = go.Figure()
-    
-    for source in pivot_df.columns:
-        color = DATA_SOURCE_COLORS.get(source, '#808080')
-        fig.add_trace(go.Bar(
-            name=source,
-            x=pivot_df.index,
-            y=pivot_df[source],
-            marker_color=color
-        ))
+    # One trace per source, built in a single Figure call
+    fig = go.Figure(data=[
+        go.Bar(name=source, x=species, y=values[:, i], marker_color=colors[i])
+        for i, source in enumerate(sources)
+    ])
     
     fig.update_layout(
-        title=f'Records by Species and Data Source (Top {top_n})',
+        **_BASE_LAYOUT,
+        title=f'Records by Species and Data Source (Top {len(pivot_df)})',
         xaxis_title='Species',
         yaxis_title='Records',
         barmode='stack',
-        template='plotly_white',
-        height=CHART_CONFIG['default_height'],
-        font=dict(size=CHART_CONFIG['font_size'])
+        height=_DEFAULT_HEIGHT
     )
     
     fig.update_xaxes(tickangle=45)
@@ -453,6 +557,7 @@ def plot_stacked_bar_by_source(df: pd.DataFrame, top_n: int = 10) -> go.Figure:
 # PIE & DONUT CHARTS
 # ============================================================================
 
+@_cache_subset_figure
 def plot_records_pie_by_source(df: pd.DataFrame) -> go.Figure:
     """
     Create pie chart showing distribution of records by data source.
@@ -463,14 +568,15 @@ def plot_records_pie_by_source(df: pd.DataFrame) -> go.Figure:
     Returns:
         plotly Figure object
     """
-    source_counts = df.groupby('Data.Source')['Records'].sum().reset_index()
+    source_counts = df.groupby('Data.Source', observed=True, sort=False)['Records'].sum()
+    sources = source_counts.index.astype(object)
     
-    colors = [DATA_SOURCE_COLORS.get(src, '#808080') for src in source_counts['Data.Source']]
+    colors = sources.map(DATA_SOURCE_COLORS).fillna('#808080').to_numpy()
     
     fig = go.Figure(data=[
         go.Pie(
-            labels=source_counts['Data.Source'],
-            values=source_counts['Records'],
+            labels=sources.to_numpy(),
+            values=source_counts.to_numpy(),
             marker=dict(colors=colors),
             hole=0.3,
             textinfo='label+percent',
@@ -479,10 +585,9 @@ def plot_records_pie_by_source(df: pd.DataFrame) -> go.Figure:
     ])
     
     fig.update_layout(
+        **_BASE_LAYOUT,
         title='Records Distribution by Data Source',
-        template='plotly_white',
-        height=CHART_CONFIG['default_height'],
-        font=dict(size=CHART_CONFIG['font_size'])
+        height=_DEFAULT_HEIGHT
     )
     
     return fig
@@ -492,8 +597,9 @@ def plot_records_pie_by_source(df: pd.DataFrame) -> go.Figure:
 # LINE CHARTS
 # ============================================================================
 
+@_cache_aggregate_figure
 def plot_temporal_trends(
-    df: pd.DataFrame,
+    temporal: pd.DataFrame,
     time_col: str = 'year',
     group_col: str = 'order'
 ) -> go.Figure:
@@ -501,37 +607,67 @@ def plot_temporal_trends(
     Create line chart showing temporal trends by taxonomic group.
     
     Args:
-        df: Input DataFrame with temporal column
+        temporal: Cumulative counts from build_temporal_counts
         time_col: Column name for time axis
         group_col: Column for grouping (e.g., 'order', 'genus')
         
     Returns:
         plotly Figure object
     """
-    if time_col not in df.columns or group_col not in df.columns:
+    if temporal.empty:
         return go.Figure()
     
-    # Aggregate by time and group
-    temporal = df.groupby([time_col, group_col]).size().reset_index(name='records')
-    
-    # Calculate cumulative
-    temporal['cumulative'] = temporal.groupby(group_col)['records'].cumsum()
-    
     fig = px.line(
         temporal,
         x=time_col,
         y='cumulative',
         color=group_col,
         markers=True,
-        title=f'Cumulative Records Over Time by {group_col.title()}'
+        title=f'Cumulative Records Over Time by {group_col.title()}',
+        template=_PX_TEMPLATE
     )
     
     fig.update_layout(
+        **_PX_LAYOUT,
         xaxis_title=time_col.title(),
         yaxis_title='Cumulative Records',
-        template='plotly_white',
-        height=CHART_CONFIG['default_height'],
-        font=dict(size=CHART_CONFIG['font_size'])
+        height=_DEFAULT_HEIGHT
+    )
+    
+    return fig
+
+
+@_cache_aggregate_figure
+def plot_yearly_records(yearly_summary: pd.DataFrame, columns: Optional[List[str]] = None) -> go.Figure:
+    """
+    Create line chart of per-year record counts.
+    
+    Args:
+        yearly_summary: Year-indexed DataFrame of counts
+        columns: Columns to plot as lines (defaults to all)
+        
+    Returns:
+        plotly Figure object
+    """
+    columns = columns or list(yearly_summary.columns)
+    
+    fig = go.Figure()
+    for i, col in enumerate(columns):
+        fig.add_trace(go.Scatter(
+            x=yearly_summary.index,
+            y=yearly_summary[col],
+            mode='lines',
+            name=col,
+            line=dict(color=CHART_COLORS[i % len(CHART_COLORS)])
+        ))
+    
+    fig.update_layout(
+        **_BASE_LAYOUT,
+        xaxis_title=yearly_summary.index.name.title() if yearly_summary.index.name else None,
+        yaxis_title='Records',
+        height=400,
+        showlegend=len(columns) > 1,
+        margin=dict(t=20)
     )
     
     return fig
@@ -541,48 +677,42 @@ def plot_temporal_trends(
 # HEATMAPS
 # ============================================================================
 
-def plot_species_grid_heatmap(df: pd.DataFrame, top_n: int = 15) -> go.Figure:
+@_cache_aggregate_figure
+def plot_species_grid_heatmap(heatmap_df: pd.DataFrame) -> go.Figure:
     """
     Create heatmap showing species presence across grids.
     
     Args:
-        df: Input DataFrame
-        top_n: Number of top species to include
+        heatmap_df: Species × grid totals from build_species_grid_pivot
         
     Returns:
         plotly Figure object
     """
-    # Get top species
-    top_species = df.groupby('Species.Name')['Records'].sum().nlargest(top_n).index
-    df_filtered = df[df['Species.Name'].isin(top_species)]
-    
-    # Create pivot table
-    heatmap_data = df_filtered.pivot_table(
-        values='Records',
-        index='Species.Name',
-        columns='Grid',
-        aggfunc='sum',
-        fill_value=0
-    )
+    heatmap_values = heatmap_df.to_numpy()
     
     fig = go.Figure(data=go.Heatmap(
-        z=heatmap_data.values,
-        x=heatmap_data.columns,
-        y=heatmap_data.index,
+        z=heatmap_values,
+        x=heatmap_df.columns.to_numpy(),
+        y=heatmap_df.index.to_numpy(),
         colorscale='YlOrRd',
-        text=heatmap_data.values,
-        texttemplate='%{text}',
-        textfont={"size": 10},
         colorbar=dict(title="Records")
     ))
     
+    # Heatmaps already draw to a canvas; the per-cell text labels are SVG
+    # elements, so only add them while the grid stays small
+    if heatmap_values.size <= _MAX_HEATMAP_LABELS:
+        fig.update_traces(
+            text=heatmap_values,
+            texttemplate='%{text}',
+            textfont={"size": 10}
+        )
+    
     fig.update_layout(
-        title=f'Species × Grid Heatmap (Top {top_n} Species)',
+        **_BASE_LAYOUT,
+        title=f'Species × Grid Heatmap (Top {len(heatmap_df)} Species)',
         xaxis_title='UTM Grid',
         yaxis_title='Species',
-        template='plotly_white',
-        height=600,
-        font=dict(size=CHART_CONFIG['font_size'])
+        height=600
     )
     
     return fig
@@ -592,6 +722,7 @@ def plot_species_grid_heatmap(df: pd.DataFrame, top_n: int = 15) -> go.Figure:
 # BOX & VIOLIN PLOTS
 # ============================================================================
 
+@_cache_subset_figure
 def plot_records_boxplot_by_source(df: pd.DataFrame) -> go.Figure:
     """
     Create box plot showing distribution of records by data source.
@@ -609,17 +740,17 @@ def plot_records_boxplot_by_source(df: pd.DataFrame) -> go.Figure:
         color='Data.Source',
         color_discrete_map=DATA_SOURCE_COLORS,
         title='Record Distribution by Data Source',
-        points='all'
+        points='all',
+        template=_PX_TEMPLATE
     )
     
     fig.update_layout(
+        **_PX_LAYOUT,
         xaxis_title='Data Source',
         yaxis_title='Records (log scale)',
         yaxis_type='log',
-        template='plotly_white',
-        height=CHART_CONFIG['default_height'],
-        showlegend=False,
-        font=dict(size=CHART_CONFIG['font_size'])
+        height=_DEFAULT_HEIGHT,
+        showlegend=False
     )
     
     return fig
@@ -629,30 +760,28 @@ def plot_records_boxplot_by_source(df: pd.DataFrame) -> go.Figure:
 # SUNBURST CHART
 # ============================================================================
 
-def plot_hierarchical_sunburst(df: pd.DataFrame) -> go.Figure:
+@_cache_aggregate_figure
+def plot_hierarchical_sunburst(sunburst_data: pd.DataFrame) -> go.Figure:
     """
     Create sunburst chart showing hierarchical data structure.
     
     Args:
-        df: Input DataFrame with Grid, Species.Name, Data.Source
+        sunburst_data: Leaf rows from build_sunburst_agg
         
     Returns:
         plotly Figure object
     """
-    # Aggregate data
-    sunburst_data = df.groupby(['Grid', 'Species.Name', 'Data.Source'])['Records'].sum().reset_index()
-    
     fig = px.sunburst(
         sunburst_data,
         path=['Grid', 'Species.Name', 'Data.Source'],
         values='Records',
-        title='Hierarchical View: Grid → Species → Source'
+        title='Hierarchical View: Grid → Species → Source',
+        template=_PX_TEMPLATE
     )
     
     fig.update_layout(
-        template='plotly_white',
-        height=600,
-        font=dict(size=CHART_CONFIG['font_size'])
+        **_PX_LAYOUT,
+        height=600
     )
     
     return fig